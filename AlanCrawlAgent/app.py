@@ -1,10 +1,15 @@
+import logging
 from datetime import datetime, timedelta
 from est_alan_scheduler.task import Task
 from est_alan_scheduler.scheduler import start_scheduler, registry
+from est_alan_scheduler.main import configure_cli_logging
+
+logger = logging.getLogger(__name__)
 
 
 def main():
-    print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S.%f')[:-3]}] est-alan-crawl-agent 데모 시작...")
+    configure_cli_logging()
+    logger.info("est-alan-crawl-agent 데모 시작...")
 
     # 예시 함수 정의
     def get_task_from_notion():
@@ -32,9 +37,9 @@ def main():
                 # 신규 task인 경우 register
                 registry.register(alan_task)
 
-        for task_id in registry.store.keys():
-            if task_id not in list_task_id:
-                registry.delete(task_id)
+        for task in registry.tasks(): # 스냅샷을 순회하므로 삭제해도 안전
+            if task.id not in list_task_id:
+                registry.delete(task.id)
 
     task_notion = Task(
         at="07:00",
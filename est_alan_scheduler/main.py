@@ -1,27 +1,46 @@
+import logging
+import sys
 from datetime import datetime, timedelta
 from est_alan_scheduler.task import Task # Task 클래스 임포트
 from est_alan_scheduler.scheduler import registry, start_scheduler # 전역 registry와 start_scheduler 임포트
 
+logger = logging.getLogger(__name__)
+
+
+def configure_cli_logging(level: int = logging.INFO):
+    """
+    데모 CLI용 로깅 설정. "[YYYY-mm-dd HH:MM:SS.mmm] 메시지" 형식으로 stdout에 출력.
+    타임스탬프는 Formatter가 실제로 출력할 때만 만든다 (호출마다 datetime.now().strftime 하지 않음).
+    이미 로깅이 설정되어 있으면 아무것도 바꾸지 않는다.
+    """
+    logging.basicConfig(
+        stream=sys.stdout,
+        level=level,
+        format="[%(asctime)s.%(msecs)03d] %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
+    )
+
+
 def main():
     """
     est-alan-scheduler CLI의 메인 함수.
     데모용 작업을 등록하고 스케줄러를 시작합니다.
     """
-    print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S.%f')[:-3]}] est-alan-scheduler CLI 데모 시작...")
+    configure_cli_logging()
+    logger.info("est-alan-scheduler CLI 데모 시작...")
 
     # 예시 함수 정의
     def cli_sample_task(message: str):
-        print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S.%f')[:-3]}] CLI Task: {message}")
+        logger.info("CLI Task: %s", message)
         return f"Message '{message}' processed at {datetime.now()}"
 
     def cli_another_task(a: int, b: int):
         result = a * b
-        print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S.%f')[:-3]}] CLI Another Task: {a} * {b} = {result}")
+        logger.info("CLI Another Task: %d * %d = %d", a, b, result)
         return result
 
     def cli_failing_task():
-        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S.%f')[:-3]
-        print(f"[{timestamp}] CLI Failing Task: 이 작업은 의도적으로 실패합니다.")
+        logger.info("CLI Failing Task: 이 작업은 의도적으로 실패합니다.")
         raise RuntimeError("CLI 데모용 의도된 실패")
 
     # Task 등록
@@ -44,7 +63,7 @@ def main():
 
     # CLI용 'at' 작업 (테스트 용이하게 현재 시간 + 25초로 설정)
     cli_at_time_str = (datetime.now() + timedelta(seconds=25)).strftime("%H:%M")
-    print(f"DEBUG (CLI): 'cli_at_daily' will be scheduled for {cli_at_time_str} daily, dependent on {task1_cli.id}.")
+    logger.debug("'cli_at_daily' will be scheduled for %s daily, dependent on %s.", cli_at_time_str, task1_cli.id)
     task3_cli_at = Task(
         at=cli_at_time_str,
         func=cli_sample_task,
@@ -62,18 +81,16 @@ def main():
     )
     registry.register(task4_cli_failing)
 
-    print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S.%f')[:-3]}] 등록된 CLI 작업들:")
-    with registry._lock: # 스레드 안전하게 접근
-        for task_id, task_obj in registry.store.items():
-            # main.py에서 생성된 작업들만 간략히 표시하거나, ID로 구분
-            if task_id.startswith("cli_"):
-                 print(f"  - {task_id} (Status: {task_obj.status}, Schedule: "
-                       f"{'every ' + str(task_obj.every) if task_obj.every else ''}"
-                       f"{'at ' + str(task_obj.at) if task_obj.at else ''}"
-                       f"{'run_at ' + str(task_obj.run_at) if task_obj.run_at else ''}"
-                       f")")
-
-    print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S.%f')[:-3]}] 스케줄러를 blocking 모드로 시작합니다. (Ctrl+C 로 종료)")
+    logger.info("등록된 CLI 작업들:")
+    for task_obj in registry.tasks(): # 스냅샷이므로 lock 불필요
+        # main.py에서 생성된 작업들만 간략히 표시하거나, ID로 구분
+        if task_obj.id.startswith("cli_"):
+             logger.info("  - %s (Status: %s, Schedule: %s%s%s)", task_obj.id, task_obj.status,
+                         'every ' + str(task_obj.every) if task_obj.every else '',
+                         'at ' + str(task_obj.at) if task_obj.at else '',
+                         'run_at ' + str(task_obj.run_at) if task_obj.run_at else '')
+
+    logger.info("스케줄러를 blocking 모드로 시작합니다. (Ctrl+C 로 종료)")
 
     # 스케줄러 시작 (1초 간격, blocking 모드)
     start_scheduler(interval=1.0, blocking=True)
@@ -1,23 +1,28 @@
 from est_alan_scheduler.task_registry import TaskRegistry
-import time
+from typing import Optional
+import os
 import threading
 
 
-#  전역 인스턴스
-registry = TaskRegistry()
+#  전역 인스턴스. 작업 함수는 스레드 풀에서 실행되어 느린 작업(크롤링 등 I/O)이 스케줄러 루프를 막지 않음
+registry = TaskRegistry(max_workers=(os.cpu_count() or 1) * 4)
 
 
 # ────────────────────────────────────────────────────────────────────────
 # 백그라운드 루프
 # ────────────────────────────────────────────────────────────────────────
 
-def start_scheduler(interval: float = 1.0, blocking: bool = False):
-    """interval(기본 1초)마다 registry.tick() 실행"""
+def start_scheduler(interval: float = 1.0, blocking: bool = False, stop: Optional[threading.Event] = None):
+    """
+    registry.tick() 실행 후 다음 작업의 실행 예정 시각까지 대기.
+    대기 시간은 interval(기본 1초)을 넘지 않고, 작업이 등록/수정/삭제되면 바로 다음 tick을 실행한다.
+    stop이 주어지면 set된 뒤 다음 tick 전에 루프를 끝낸다 (대기 중인 루프는 registry.wake()로 바로 깨울 수 있음).
+    """
 
     def loop():
-        while True:
+        while stop is None or not stop.is_set():
             registry.tick()
-            time.sleep(interval)
+            registry.wait_for_next_run(interval)
 
     if blocking:
         loop()
@@ -1,23 +1,64 @@
 from __future__ import annotations
 
 import enum
+import functools
+import sys
 import uuid
-from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional, Tuple, Literal
+from collections import deque
+from datetime import datetime, timedelta
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple, Literal
 
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, PrivateAttr, field_serializer, field_validator
 
 # ────────────────────────────────────────────────────────────────────────
 # 모델 정의
 # ────────────────────────────────────────────────────────────────────────
 
-class TaskStatus(str, enum.Enum):
-    """작업 상태값"""
+class TaskStatus(enum.IntEnum):
+    """작업 상태값 (tick/history에서 자주 비교하므로 정수 값 사용)"""
 
-    PENDING = "pending"     # 시간 조건 충족했으나 선행 작업 대기 중
-    RUNNING = "running"     # 실행 중
-    SUCCESS = "success"     # 최근 실행 성공
-    FAILED = "failed"       # 최근 실행 실패
+    PENDING = 0     # 시간 조건 충족했으나 선행 작업 대기 중
+    RUNNING = 1     # 실행 중
+    SUCCESS = 2     # 최근 실행 성공
+    FAILED = 3      # 최근 실행 실패
+
+    def __str__(self) -> str:
+        # 출력/로그에는 정수 대신 기존과 같은 소문자 이름("pending" 등)을 사용
+        return self.name.lower()
+
+    def __format__(self, format_spec: str) -> str:
+        return format(str(self), format_spec)
+
+
+class HistoryEntry:
+    """
+    history 항목 하나 (실행 시각, 상태, 결과 repr, 오류 메시지).
+    실행마다 dict를 만들지 않도록 슬롯 클래스로 두고, 기존 코드처럼 entry["result"] 형태로도 읽을 수 있다.
+    """
+
+    __slots__ = ("run_at", "status", "result", "error")
+
+    def __init__(self, run_at: Optional[datetime], status: TaskStatus, result: Any = None, error: Optional[str] = None):
+        self.run_at = run_at
+        self.status = status
+        self.result = result
+        self.error = error
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def _asdict(self) -> Dict[str, Any]:
+        return {key: getattr(self, key) for key in self.__slots__}
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, HistoryEntry):
+            other = other._asdict()
+        return self._asdict() == other
+
+    def __repr__(self) -> str:
+        return f"HistoryEntry({self._asdict()!r})"
 
 
 class Task(BaseModel):
@@ -35,19 +76,42 @@ class Task(BaseModel):
     # ── 실행 정의 ───────────────────────────────────────────────────
     func: Callable[..., Any]
     args: Tuple[Any, ...] = ()
-    kwargs: Dict[str, Any] = {}
-    depends_on: List[str] = []               # 선행 작업 ID 목록
+    kwargs: Dict[str, Any] = Field(default_factory=dict)
+    depends_on: List[str] = Field(default_factory=list)  # 선행 작업 ID 목록
+    pure: bool = False  # True면 선행 작업 결과가 그대로일 때 func를 다시 호출하지 않고 result 재사용
 
     # ── 런타임 상태(자동 관리) ─────────────────────────────────────
     status: TaskStatus = TaskStatus.PENDING
     last_success_at: Optional[datetime] = None  # 최근 성공 시각
     last_run_at: Optional[datetime] = None      # 최근 실행 시각(성공/실패 모두)
+    next_run_at: Optional[datetime] = None      # 다음 실행 예정 시각(TaskRegistry가 관리)
     result: Any = None
     error_message: Optional[str] = None  # 예외 메시지 문자열 저장
-    history: List[Dict[str, Any]] = []
-    # max_history_entries: int = 50 # 예시: history 크기 제한 옵션 (이번에는 미적용)
-
-    @validator('at')
+    history: Deque[Any] = Field(default_factory=deque)  # HistoryEntry 목록, 최근 max_history_entries개만 보관
+    max_history_entries: Optional[int] = 50  # history 크기 제한 (None이면 무제한, 0이면 기록 안 함)
+    # True면 history의 result repr을 실행 직후에 계산 (기본값은 처음 읽을 때 계산하므로,
+    # 실행 후 결과 객체를 계속 고치는 작업은 읽는 시점의 상태가 보임)
+    record_result_repr: bool = False
+
+    # ── 파생 캐시(정의 필드에서 계산, 실행마다 다시 만들지 않음) ────────
+    _schedule_kind: Optional[str] = PrivateAttr(default=None)  # "run_at" / "at" / "every" (지정된 스케줄 옵션)
+    _at_hm: Optional[Tuple[int, int]] = PrivateAttr(default=None)
+    _every_delta: Optional[timedelta] = PrivateAttr(default=None)
+    _at_fire_day: Optional[int] = PrivateAttr(default=None)  # _at_fire_at이 계산된 날짜(ordinal)
+    _at_fire_at: Optional[datetime] = PrivateAttr(default=None)  # 해당 날짜의 at 실행 시각
+    _dep_kwarg_keys: Tuple[str, ...] = PrivateAttr(default=())  # depends_on 순서의 "dep_<id>"
+    _dep_refs: Optional[Tuple[Tuple[str, Any], ...]] = PrivateAttr(default=None)  # ("dep_<id>", 선행 Task) 목록 (TaskRegistry가 관리)
+    _call: Optional[Callable[..., Any]] = PrivateAttr(default=None)  # func에 args(와 kwargs)를 미리 묶은 partial
+    _call_kwargs: Optional[Dict[str, Any]] = PrivateAttr(default=None)  # 선행 작업이 있을 때: kwargs + dep_* 슬롯 (재사용)
+    _deps_satisfied: int = PrivateAttr(default=0)  # 성공 이력이 있는 선행 작업 수 (TaskRegistry가 관리)
+    _result_version: int = PrivateAttr(default=0)  # func를 실제로 실행해 성공할 때마다 증가
+    _memo_key: Optional[Tuple[int, ...]] = PrivateAttr(default=None)  # pure 작업: result를 만든 선행 작업 버전
+
+    # 가변 기본값은 default_factory로 생성 (기본값 deepcopy 비용 없음).
+    # 검증은 생성 시에만 수행되고 속성 대입(task.status = ...)은 검증하지 않음 (validate_assignment 미사용).
+
+    @field_validator('at')
+    @classmethod
     def validate_at_format(cls, v: Optional[str]) -> Optional[str]:
         if v is not None:
             try:
@@ -57,7 +121,8 @@ class Task(BaseModel):
                 raise ValueError("at field must be in HH:MM format")
         return v
 
-    @validator('every')
+    @field_validator('every')
+    @classmethod
     def validate_every_keys(cls, v: Optional[Dict[str, int]]) -> Optional[Dict[str, int]]:
         if v is not None:
             allowed_keys = {"days", "seconds", "microseconds", "milliseconds", "minutes", "hours", "weeks"}
@@ -70,6 +135,67 @@ class Task(BaseModel):
                 raise ValueError("'every' field cannot be an empty dictionary.")
         return v
 
+    @field_validator('depends_on')
+    @classmethod
+    def intern_depends_on(cls, v: List[str]) -> List[str]:
+        # store 조회 키와 같은 객체가 되도록 intern (등록 시 task.id도 intern됨).
+        # 중복 ID는 순서를 유지한 채 하나만 남김 (선행 작업 카운터는 서로 다른 선행 작업 수를 셈)
+        return list(dict.fromkeys(sys.intern(dep_id) for dep_id in v))
+
+    @field_serializer('history')
+    def serialize_history(self, history: Deque[Any]) -> List[Dict[str, Any]]:
+        """직렬화 시 history는 list로, 지연 계산되는 "result" repr은 문자열로 변환"""
+        return self.history_records()
+
+    def history_records(self) -> List[Dict[str, Any]]:
+        """history의 사본(list). "result"는 repr 문자열(또는 None)로 확정해서 돌려준다."""
+        records = []
+        for entry in self.history:
+            record = entry._asdict() if isinstance(entry, HistoryEntry) else dict(entry)
+            if record.get("result") is not None:
+                record["result"] = str(record["result"])
+            records.append(record)
+        return records
+
+    def model_post_init(self, __context: Any) -> None:
+        self._bound_history()
+        self._refresh_cache()
+
+    def _bound_history(self):
+        """history를 max_history_entries 크기의 링 버퍼로 맞춘다. 오래된 항목은 append 시 자동으로 밀려남."""
+        if self.history.maxlen != self.max_history_entries:
+            self.history = deque(self.history, maxlen=self.max_history_entries)
+
+    def _refresh_cache(self):
+        """스케줄/실행 정의가 바뀌면 호출. 파생 값을 캐시해 둔다."""
+        # 여러 개가 지정된 경우(등록 시 거부됨)에도 run_at > at > every 순으로 하나를 고름
+        if self.run_at is not None:
+            self._schedule_kind = "run_at"
+        elif self.at is not None:
+            self._schedule_kind = "at"
+        elif self.every is not None:
+            self._schedule_kind = "every"
+        else:
+            self._schedule_kind = None
+        if self.at is not None:
+            hh, mm = self.at.split(":")
+            self._at_hm = (int(hh), int(mm))
+        else:
+            self._at_hm = None
+        self._at_fire_day = self._at_fire_at = None
+        self._every_delta = timedelta(**self.every) if self.every is not None else None
+        self._dep_kwarg_keys = tuple(sys.intern(f"dep_{dep_id}") for dep_id in self.depends_on)
+        self._dep_refs = None  # depends_on이 바뀌었을 수 있으므로 다음 실행 때 다시 찾음
+        # func/args/kwargs를 바꾸려면 update()를 사용 (직접 대입하면 이 partial에 반영되지 않음)
+        if self.depends_on:
+            # kwargs 사본에 dep_* 값만 덮어써서 호출. partial에 kwargs까지 묶으면 호출마다 병합 dict가 새로 생김
+            self._call = functools.partial(self.func, *self.args)
+            self._call_kwargs = dict(self.kwargs)
+        else:
+            self._call = functools.partial(self.func, *self.args, **self.kwargs)
+            self._call_kwargs = None
+        self._memo_key = None  # 정의가 바뀌면 이전 result는 재사용하지 않음
+
     def update(self, task: Task):
         self.tags = task.tags
 
@@ -83,6 +209,11 @@ class Task(BaseModel):
         self.args = task.args
         self.kwargs = task.kwargs
         self.depends_on = task.depends_on
+        self.pure = task.pure
+        self.max_history_entries = task.max_history_entries
+        self.record_result_repr = task.record_result_repr
+        self._bound_history()
+        self._refresh_cache()
 
         # ── 런타임 상태(자동 관리) ─────────────────────────────────────
         # 해당 정보는 기존 정보를 그대로 가져옴
@@ -1,45 +1,218 @@
-from est_alan_scheduler.task import Task, TaskStatus
+from est_alan_scheduler.task import HistoryEntry, Task, TaskStatus
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, time as dtime
-from typing import Dict, Any # Added Any
+from typing import Callable, Dict, Any, List, Optional, Set, Tuple # Added Any
+import heapq
+import itertools
+import sys
 import threading
+import time
+
+
+# TaskRegistry._check_runnable 판정 결과
+_RUNNABLE, _BUSY, _NOT_DUE, _BLOCKED = range(4)
+
+
+class _LazyRepr:
+    """
+    history의 "result" 값. repr(result)를 실행 시점이 아니라 처음 읽힐 때 계산하고,
+    계산 후에는 원본 객체 참조를 놓는다. 계산된 문자열과 같은 값으로 비교된다.
+    그 사이에 결과 객체가 바뀌면 바뀐 뒤의 repr이 기록된다 (실행 시점의 값이 필요하면 Task.record_result_repr).
+    """
+
+    __slots__ = ("_obj", "_text")
+
+    def __init__(self, obj: Any):
+        self._obj = obj
+        self._text: Optional[str] = None
+
+    def __str__(self) -> str:
+        # 여러 스레드가 동시에 읽을 수 있으므로 원본을 먼저 지역 변수로 잡고, 쓸 때는 문자열을 기록한 뒤에 원본을 놓는다.
+        # 그러면 원본이 이미 놓였을 때는 _text가 항상 채워져 있다 (repr이 두 번 계산될 수는 있지만 결과는 같음)
+        obj = self._obj
+        text = self._text
+        if text is None:
+            text = repr(obj)
+            self._text = text
+            self._obj = None
+        return text
+
+    def __repr__(self) -> str:
+        return repr(str(self))  # 컨테이너 안에서는 기존처럼 문자열로 보이게
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, _LazyRepr):
+            other = str(other)
+        return str(self) == other
+
+    def __hash__(self) -> int:
+        return hash(str(self))
 
 
 class TaskRegistry:
     """작업을 저장하고 실행을 관리한다."""
 
-    def __init__(self):
+    def __init__(self, max_workers: Optional[int] = None, max_queued: Optional[int] = None,
+                 clock: Optional[Callable[[], datetime]] = None):
+        """
+        max_workers가 주어지면 작업 함수를 그 크기의 스레드 풀에서 실행하고, tick은 완료를 기다리지 않는다.
+        None(기본값)이면 tick을 호출한 스레드에서 순서대로 실행한다.
+        max_queued는 워커를 기다리며 풀 큐에 쌓일 수 있는 작업 수 (기본값 max_workers).
+        실행 중 + 대기 중인 작업이 max_workers + max_queued개면, 나머지는 제출하지 않고 다음 tick으로 미룬다.
+        clock은 현재 시각을 돌려주는 함수 (기본값 None이면 datetime.now). 테스트에서 시각을 직접 정할 때 사용.
+        """
         self.store: Dict[str, Task] = {}
+        self._clock = clock
         self._lock = threading.Lock()
+        # 워커 스레드는 첫 submit 때 생성되고, 인터프리터 종료 시 concurrent.futures가 정리함
+        self._pool: Optional[ThreadPoolExecutor] = (
+            ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="est-alan-task")
+            if max_workers else None
+        )
+        self._max_inflight = (max_workers + (max_queued if max_queued is not None else max_workers)
+                              if max_workers else 0)
+        self._inflight = 0  # 풀에 제출했지만 아직 끝나지 않은 작업 수 (self._lock 하에서 변경)
+        # (다음 실행 예정 시각, task_id) 최소 힙. 일정이 바뀌면 새 항목을 넣고,
+        # task.next_run_at과 시각이 다른 이전 항목은 꺼낼 때 버린다 (lazy deletion).
+        self._run_heap: List[Tuple[datetime, str]] = []
+        # 시간 조건은 충족했으나 풀의 빈 자리 등을 기다리는 작업 ID. 매 tick 다시 검사.
+        self._waiting: Set[str] = set()
+        # 시간 조건은 충족했으나 선행 작업이 아직 성공하지 않은 작업 ID. tick은 이 작업들을 다시 보지 않고,
+        # 선행 작업 카운터가 다 차는 시점(_mark_first_success/_recount_dependents)에 _waiting으로 옮긴다.
+        # register/update/delete를 거치지 않고 store의 작업을 직접 고치면 카운터가 갱신되지 않으므로,
+        # 여기 들어간 작업은 update()로 다시 판정하게 해야 한다.
+        self._blocked: Set[str] = set()
+        # 선행 작업 ID → 그 작업에 의존하는 작업 ID들. 선행 작업이 처음 성공하면
+        # 의존 작업의 _deps_satisfied를 올려, _deps_ready가 매번 선행 작업을 훑지 않게 한다.
+        self._dependents: Dict[str, Set[str]] = {}
+        # 등록된 작업의 불변 스냅샷. store 구조가 바뀔 때만 lock 하에서 새로 만들고(copy-on-write),
+        # 읽는 쪽은 lock 없이 그대로 순회한다.
+        self._task_snapshot: Tuple[Task, ...] = ()
+        # 작업 구성이 바뀌면 set → wait_for_next_run으로 대기 중인 스케줄러 루프를 바로 깨움.
+        # _lock과 독립적인 Event로 둔다.
+        self._wake = threading.Event()
+        # 마지막 tick의 (벽시계, monotonic) 시각. seconds_until_next_run이 벽시계를 다시 읽지 않고
+        # 이 값 + 경과 시간으로 현재 시각을 구한다 (루프 한 바퀴에 datetime.now()는 tick의 한 번뿐).
+        self._clock_base: Optional[Tuple[datetime, float]] = None
 
     # ── 퍼블릭 API ───────────────────────────────────────────────────
 
     def register(self, task: Task) -> Task:
         """작업 등록. 스케줄 옵션은 하나만 지정돼야 한다."""
+        # task만 보는 검증/준비는 lock 밖에서 (lock은 store와 색인을 바꾸는 동안만 잡음)
+        self._check_schedule_options(task)
+        task.id = sys.intern(task.id)  # store/_dependents/depends_on 키 비교가 포인터 비교로 끝나도록
         with self._lock:
-            if sum(opt is not None for opt in (task.every, task.at, task.run_at)) != 1:
-                raise ValueError("Task must specify exactly one of every / at / run_at schedule options")
             if task.id in self.store:
                 # 혹은 업데이트를 허용할 것인가? 현재는 중복 ID 시 에러 발생하도록 함 (덮어쓰기 방지)
                 raise ValueError(f"Task with id '{task.id}' already registered.")
             self.store[task.id] = task
-            return task
+            self._task_snapshot = tuple(self.store.values())
+            self._link_dependencies(task)
+            self._recount_dependents(task.id)  # 이 작업을 기다리던 작업이 이미 있을 수 있음
+            self._schedule(task, self._now())
+        self.wake()
+        return task
 
     def update(self, task: Task):
+        self._check_schedule_options(task)  # 새 정의만 보는 검증이므로 lock 밖에서
         with self._lock:
-            if sum(opt is not None for opt in (task.every, task.at, task.run_at)) != 1:
-                raise ValueError("Task must specify exactly one of every / at / run_at schedule options")
-            self.store[task.id].update(task)
+            stored = self.store[task.id]
+            self._unlink_dependencies(stored)
+            stored.update(task)
+            self._link_dependencies(stored)
+            if stored.id in self._blocked:  # depends_on이 바뀌었을 수 있으므로 다음 tick에 다시 판정
+                self._blocked.discard(stored.id)
+                self._waiting.add(stored.id)
+            self._schedule(stored, self._now())
+        self.wake()
 
     def delete(self, task_id):
+        # 없는 ID면 lock을 잡지 않고 반환 (GIL 하의 dict/set 멤버십 확인. 경합 시에는 아래에서 다시 확인됨)
+        if task_id not in self.store and task_id not in self._waiting and task_id not in self._blocked:
+            return
+        with self._lock:
+            task = self.store.pop(task_id, None)  # 존재 확인과 제거를 한 번의 조회로
+            if task is not None:
+                self._unlink_dependencies(task)
+                self._task_snapshot = tuple(self.store.values())
+                self._recount_dependents(task_id)  # 의존 작업은 다시 선행 작업 대기 상태가 됨
+            self._waiting.discard(task_id)
+            self._blocked.discard(task_id)
+        self.wake()
+
+    def clear(self):
+        """모든 작업과 스케줄 상태를 제거한다."""
         with self._lock:
-            if task_id in self.store.keys():
-                del self.store[task_id]
+            # 항목을 하나씩 지우지 않고 빈 컨테이너로 교체 (이전 컨테이너는 참조가 사라질 때 한꺼번에 해제)
+            self.store = {}
+            self._run_heap = []
+            self._waiting = set()
+            self._blocked = set()
+            self._dependents = {}
+            self._task_snapshot = ()
+            self._clock_base = None  # 다음 tick 전까지는 벽시계 기준
+        self.wake()  # 대기 중인 루프가 비워진 힙 기준으로 다시 대기하도록
+
+    def tasks(self) -> Tuple[Task, ...]:
+        """
+        등록된 작업들의 스냅샷. lock 없이 읽으며,
+        순회 중 register/delete가 일어나도 영향을 받지 않는다.
+        """
+        return self._task_snapshot
+
+    def shutdown(self, wait: bool = True):
+        """스레드 풀을 정리한다. wait=True면 실행 중인 작업이 끝날 때까지 기다림."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=wait)
+
+    def seconds_until_next_run(self, max_wait: float) -> float:
+        """다음 실행 예정 작업까지 남은 시간(초). max_wait를 넘지 않는다."""
+        with self._lock:
+            heap = self._run_heap
+            while heap and not self._is_live(heap[0]):
+                heapq.heappop(heap)  # 무효가 된 항목 정리
+            if not heap:
+                return max_wait
+            delay = (heap[0][0] - self._current_time()).total_seconds()
+        return min(max(delay, 0.0), max_wait)
+
+    def wake(self):
+        """wait_for_next_run으로 대기 중인 스케줄러 루프를 깨워 바로 다음 tick을 실행하게 한다."""
+        self._wake.set()
+
+    def wait_for_next_run(self, max_wait: float) -> bool:
+        """
+        다음 실행 예정 시각까지(최대 max_wait초) 대기. register/update/delete 또는 wake()가 호출되면 바로 반환.
+        그렇게 깨어났으면 True. 마지막 tick 시작 이후에 wake()가 호출됐으면 기다리지 않고 바로 반환.
+        """
+        # wake 신호는 tick 시작 시 지운다. 여기서 지우면 tick 도중/직후의 wake()
+        # (풀 작업 완료, 선행 작업의 첫 성공 등 _waiting만 바꾸는 경우)를 놓쳐 max_wait를 다 기다리게 됨
+        return self._wake.wait(self.seconds_until_next_run(max_wait))
 
     # ── 내부 유틸 ───────────────────────────────────────────────────
 
+    def _now(self) -> datetime:
+        """벽시계 현재 시각. clock이 주어졌으면 그 값을 사용."""
+        # datetime.now를 기본 인자로 묶지 않고 호출 시점에 찾는다 (freezegun 등의 patch가 적용되도록)
+        return self._clock() if self._clock is not None else datetime.now()
+
+    def _current_time(self) -> datetime:
+        """마지막 tick 시각 + monotonic 경과 시간. tick 전이면 벽시계를 읽는다."""
+        base = self._clock_base
+        if base is None:
+            return self._now()
+        tick_now, tick_mono = base
+        return tick_now + timedelta(seconds=time.monotonic() - tick_mono)
+
     def _deps_ready(self, task: Task) -> bool:
         """선행 작업이 존재하고, 한 번 이상 성공했는지 검사"""
         # 이 메서드는 self._lock 하에서 호출되어야 함
+        if task._deps_satisfied >= len(task.depends_on):
+            return True  # 카운터로 판단 (선행 작업이 처음 성공할 때 갱신됨)
+        # 카운터가 모자라면 직접 확인하고 카운터를 맞춘다 (store를 직접 조작한 경우 등).
+        # tick에서는 _blocked에 들어가기 전의 판정에서만 호출된다
+        task._deps_satisfied = self._count_satisfied(task)
         for dep_id in task.depends_on:
             dep_task = self.store.get(dep_id)
             if dep_task is None:
@@ -52,112 +225,394 @@ class TaskRegistry:
                 return False
         return True
 
+    def _check_runnable(self, task: Task, now: datetime) -> int:
+        """
+        tick 후보 하나의 상태 판정. 실행 중 여부, 시간 조건, 선행 작업 조건을 한 번의 호출로 검사한다.
+        반환값: _BUSY(실행 중) / _NOT_DUE(시간 조건 미충족) / _BLOCKED(선행 작업 대기) / _RUNNABLE.
+        시간 조건을 먼저 본다 (미충족이면 다시 예약, 선행 작업 대기면 대기 목록 → 처리가 다름).
+        이 메서드는 self._lock 하에서 호출되어야 함.
+        """
+        if task.status == TaskStatus.RUNNING:
+            return _BUSY
+        should_run = self._SHOULD_RUN.get(task._schedule_kind)
+        if should_run is None or not should_run(self, task, now):
+            return _NOT_DUE
+        # 선행 작업 카운터가 차 있으면 _deps_ready 호출 없이 통과
+        if task._deps_satisfied < len(task.depends_on) and not self._deps_ready(task):
+            return _BLOCKED
+        return _RUNNABLE
+
+    def _count_satisfied(self, task: Task) -> int:
+        """store에 있고 성공 이력이 있는 선행 작업 수. self._lock 하에서 호출되어야 함."""
+        count = 0
+        for dep_id in task.depends_on:
+            dep_task = self.store.get(dep_id)
+            if dep_task is not None and dep_task.last_success_at is not None:
+                count += 1
+        return count
+
+    def _link_dependencies(self, task: Task):
+        """task를 선행 작업들의 의존 목록에 넣고 카운터를 초기화. self._lock 하에서 호출되어야 함."""
+        for dep_id in task.depends_on:
+            self._dependents.setdefault(dep_id, set()).add(task.id)
+        task._deps_satisfied = self._count_satisfied(task)
+
+    def _unlink_dependencies(self, task: Task):
+        """task를 선행 작업들의 의존 목록에서 뺀다. self._lock 하에서 호출되어야 함."""
+        for dep_id in task.depends_on:
+            dependents = self._dependents.get(dep_id)
+            if dependents is not None:
+                dependents.discard(task.id)
+                if not dependents:
+                    del self._dependents[dep_id]
+
+    def _recount_dependents(self, dep_id: str):
+        """dep_id 작업이 추가/삭제된 뒤 의존 작업들의 카운터를 다시 센다. self._lock 하에서 호출되어야 함."""
+        for dependent_id in self._dependents.get(dep_id, ()):
+            dependent = self.store.get(dependent_id)
+            if dependent is not None:
+                dependent._deps_satisfied = self._count_satisfied(dependent)
+                dependent._dep_refs = None  # 선행 Task 객체가 바뀌었으므로 다음 실행 때 다시 찾음
+                # pure 작업의 재사용 키는 선행 Task 객체별 버전이라, 새 객체(버전 0부터)와는 비교할 수 없음
+                dependent._memo_key = None
+                self._release_if_ready(dependent)
+
+    def _release_if_ready(self, task: Task) -> bool:
+        """
+        선행 작업 대기(_blocked) 중이던 task의 카운터가 다 찼으면 다음 tick에서 검사하도록 _waiting으로 옮긴다.
+        옮겼으면 True. self._lock 하에서 호출되어야 함.
+        """
+        if task.id in self._blocked and task._deps_satisfied >= len(task.depends_on):
+            self._blocked.discard(task.id)
+            self._waiting.add(task.id)
+            return True
+        return False
+
+    def _mark_first_success(self, task: Task, success_at: datetime):
+        """
+        처음 성공한 작업의 last_success_at을 기록하고 의존 작업들의 카운터를 올린다.
+        그 결과 선행 작업을 모두 갖춘 대기 작업이 생기면 스케줄러 루프를 깨워 바로 실행하게 한다.
+        """
+        unblocked = False
+        with self._lock:
+            if task.last_success_at is not None:  # 다른 스레드가 먼저 기록함
+                task.last_success_at = success_at
+                return
+            task.last_success_at = success_at
+            if self.store.get(task.id) is not task:
+                return  # 등록되지 않았거나 삭제된 작업
+            for dependent_id in self._dependents.get(task.id, ()):
+                dependent = self.store.get(dependent_id)
+                if dependent is not None:
+                    dependent._deps_satisfied += 1
+                    unblocked |= self._release_if_ready(dependent)
+        if unblocked:
+            self.wake()
+
     def _should_run(self, task: Task, now: datetime) -> bool:
         """
         시간 조건 충족 여부 판단. 충족 시 True 반환.
         Task 상태 변경은 이 함수 외부 (tick 메서드 내)에서 관리.
         이 함수는 self._lock 하에서 호출되어야 함.
+        스케줄 종류는 Task에 미리 정해져 있으므로 종류별 검사 함수로 바로 분기한다.
         """
-        run_condition = False
-
-        # 1) 1회성(run_at) - 지정된 시간 이후에 아직 실행 시도된 적 없으면 실행
-        if task.run_at is not None:
-            if task.last_run_at is None and now >= task.run_at:
-                run_condition = True
-
-        # 2) 매일 고정 시각(at) - 지정된 시간이 되었고, 오늘 아직 실행 시도 안 했으면 실행
-        elif task.at is not None:
-            # Task 모델 validator가 "HH:MM" 형식을 보장한다고 가정
-            hh, mm = map(int, task.at.split(":"))
-
-            # 지정된 실행 시간 (오늘)
-            # now가 naive datetime이라고 가정 (현재 코드베이스 전체적으로 naive 사용)
-            potential_run_datetime = now.replace(hour=hh, minute=mm, second=0, microsecond=0)
-
-            if now >= potential_run_datetime:  # 지정된 시간이 되었거나 이미 지났다면
-                # 오늘 아직 실행 시도하지 않았다면 (last_run_at 기준)
-                if not (task.last_run_at and task.last_run_at.date() == now.date()):
-                    run_condition = True
-
-        # 3) 간격 반복(every) - 마지막 실행으로부터 interval이 지났거나, 아직 한 번도 실행 안 됐으면 실행
-        elif task.every is not None:
-            # Task 모델 validator가 'every' 딕셔너리의 유효성을 보장한다고 가정
-            interval = timedelta(**task.every)
-            if task.last_run_at is None:  # 첫 실행 시도
-                run_condition = True
-            elif (now - task.last_run_at >= interval):  # 마지막 실행 시도 후 interval 경과
-                run_condition = True
-        else:
+        should_run = self._SHOULD_RUN.get(task._schedule_kind)
+        if should_run is None:
             # 이 경우는 register에서 이미 걸러지지만, 방어적으로 처리.
             # Task 생성 시 스케줄 옵션이 없는 경우에 해당할 수 있음.
             # ValueError를 발생시키기보다 False를 반환하고 로깅하는 것이 tick 루프에 안전.
             # print(f"Warning: Task {task.id} is missing a schedule option.") # 실제로는 로거 사용
-            pass # run_condition remains False
+            return False
+        return should_run(self, task, now)
+
+    def _should_run_run_at(self, task: Task, now: datetime) -> bool:
+        """1회성(run_at) - 지정된 시간 이후에 아직 실행 시도된 적 없으면 실행"""
+        return task.last_run_at is None and now >= task.run_at
+
+    def _should_run_at(self, task: Task, now: datetime) -> bool:
+        """매일 고정 시각(at) - 지정된 시간이 되었고, 오늘 아직 실행 시도 안 했으면 실행"""
+        # 지정된 실행 시간 (오늘). 하루 동안은 캐시된 값을 재사용
+        # now가 naive datetime이라고 가정 (현재 코드베이스 전체적으로 naive 사용)
+        if now < self._at_fire_time(task, now):
+            return False
+        # 오늘 아직 실행 시도하지 않았다면 (last_run_at 기준)
+        return not self._ran_on_fire_day(task)
+
+    def _should_run_every(self, task: Task, now: datetime) -> bool:
+        """간격 반복(every) - 마지막 실행으로부터 interval이 지났거나, 아직 한 번도 실행 안 됐으면 실행"""
+        # Task 모델 validator가 'every' 딕셔너리의 유효성을 보장하고, timedelta는 Task에 캐시됨
+        return task.last_run_at is None or now - task.last_run_at >= task._every_delta
+
+    # 스케줄 종류(Task._schedule_kind)별 검사 함수. 분기는 Task 정의가 바뀔 때 한 번만 정해진다.
+    _SHOULD_RUN = {"run_at": _should_run_run_at, "at": _should_run_at, "every": _should_run_every}
+
+    @staticmethod
+    def _check_schedule_options(task: Task):
+        """every / at / run_at 중 정확히 하나만 지정되었는지 확인 (지정된 옵션을 비트로 모아 단일 비트인지 검사)"""
+        mask = (task.every is not None) | ((task.at is not None) << 1) | ((task.run_at is not None) << 2)
+        if mask not in (1, 2, 4):
+            raise ValueError("Task must specify exactly one of every / at / run_at schedule options")
+
+    def _is_live(self, entry: Tuple[datetime, str]) -> bool:
+        """힙 항목이 현재 store의 작업 일정과 일치하는지. self._lock 하에서 호출되어야 함."""
+        run_time, task_id = entry
+        task = self.store.get(task_id)
+        return task is not None and task.next_run_at == run_time
+
+    def _next_run_time(self, task: Task, now: datetime) -> Optional[datetime]:
+        """
+        시간 조건이 다음으로 충족되는 시각. 더 이상 실행할 일이 없으면 None.
+        _should_run(task, t)는 t >= 이 값일 때 True가 된다.
+        """
+        next_run_time = self._NEXT_RUN_TIME.get(task._schedule_kind)
+        return next_run_time(self, task, now) if next_run_time is not None else None
+
+    def _next_run_time_run_at(self, task: Task, now: datetime) -> Optional[datetime]:
+        return task.run_at if task.last_run_at is None else None  # 실행 후에는 더 이상 예약하지 않음
 
-        return run_condition
+    def _next_run_time_at(self, task: Task, now: datetime) -> Optional[datetime]:
+        fire_at = self._at_fire_time(task, now)
+        if self._ran_on_fire_day(task):
+            fire_at += timedelta(days=1)  # 오늘은 이미 실행 시도함 → 내일
+        return fire_at
+
+    def _next_run_time_every(self, task: Task, now: datetime) -> Optional[datetime]:
+        if task.last_run_at is None:
+            return now
+        return task.last_run_at + task._every_delta
+
+    _NEXT_RUN_TIME = {"run_at": _next_run_time_run_at, "at": _next_run_time_at, "every": _next_run_time_every}
+
+    def _at_fire_time(self, task: Task, now: datetime) -> datetime:
+        """'at' 작업의 오늘(now 기준) 실행 시각. 날짜가 바뀔 때만 새로 계산해 Task에 캐시."""
+        day = now.toordinal()
+        if task._at_fire_day != day:
+            # Task 모델 validator가 "HH:MM" 형식을 보장하고, 파싱 결과는 Task에 캐시됨
+            hh, mm = task._at_hm
+            task._at_fire_at = now.replace(hour=hh, minute=mm, second=0, microsecond=0)
+            task._at_fire_day = day
+        return task._at_fire_at
+
+    @staticmethod
+    def _ran_on_fire_day(task: Task) -> bool:
+        """
+        'at' 작업이 _at_fire_time으로 방금 계산한 날(now의 날짜)에 이미 실행 시도했는지.
+        date 객체를 만들지 않고 정수 ordinal로 비교한다. _at_fire_time 호출 직후에만 사용.
+        """
+        return task.last_run_at is not None and task.last_run_at.toordinal() == task._at_fire_day
+
+    def _schedule(self, task: Task, now: datetime):
+        """작업의 다음 실행 예정 시각을 힙에 넣는다. self._lock 하에서 호출되어야 함."""
+        task.next_run_at = next_run = self._next_run_time(task, now)
+        if next_run is not None:
+            heapq.heappush(self._run_heap, (next_run, task.id))
+            if len(self._run_heap) > 2 * len(self.store) + self._HEAP_SLACK:
+                self._compact_heap()
+
+    # 무효 항목이 이만큼 + 작업 수보다 많이 쌓이면 힙을 다시 만든다
+    _HEAP_SLACK = 64
+
+    def _compact_heap(self):
+        """
+        update/delete가 잦으면 lazy deletion으로 무효 항목이 쌓이므로, 유효한 항목만으로 힙을 다시 만든다.
+        self._lock 하에서 호출되어야 함.
+        """
+        self._run_heap = [
+            (task.next_run_at, task_id) for task_id, task in self.store.items() if task.next_run_at is not None
+        ]
+        heapq.heapify(self._run_heap)
 
     # _execute는 _execute_task_logic으로 대체/수정될 예정
-    def _execute_task_logic(self, task: Task, dep_kwargs: Dict[str, Any], current_run_time: datetime):
+    def _resolve_dep_refs(self, task: Task) -> Tuple[Tuple[str, Task], ...]:
+        """
+        task의 ("dep_<id>", 선행 Task) 목록. 선행 작업이 등록/삭제될 때까지 재사용해서
+        tick마다 store를 다시 조회하지 않는다. 없는 선행 작업이 있으면 KeyError. self._lock 하에서 호출되어야 함.
+        """
+        refs = task._dep_refs
+        if refs is None:
+            refs = task._dep_refs = tuple(
+                (dep_key, self.store[dep_id]) for dep_key, dep_id in zip(task._dep_kwarg_keys, task.depends_on)
+            )
+        return refs
+
+    def _dep_versions(self, task: Task) -> Tuple[int, ...]:
+        """선행 작업들의 result 버전. pure 작업의 재사용 판단 키. self._lock 하에서 호출되어야 함."""
+        return tuple(self.store[dep_id]._result_version for dep_id in task.depends_on)
+
+    def _execute_task_logic(self, task: Task, dep_kwargs: Dict[str, Any], current_run_time: datetime,
+                            dep_versions: Optional[Tuple[int, ...]] = None, started_ns: Optional[int] = None):
         """
         실제 작업 함수를 실행하고 결과를 기록.
         이 함수는 self._lock 외부에서 호출되어야 함.
         task.status는 호출 전에 RUNNING으로, task.last_run_at은 current_run_time으로 설정되어 있어야 함.
+        dep_versions는 tick이 dep_kwargs와 함께 lock 하에서 모은 선행 작업 버전 (pure 작업만 사용).
+        started_ns는 current_run_time에 해당하는 time.monotonic_ns() 값 (tick 시작 시각).
+        None이면 호출 시점을 사용. 풀 큐에서 기다린 시간도 성공 시각에 포함되도록 tick이 넘긴다.
         """
+        if task.pure and dep_versions is None:
+            try:
+                with self._lock:
+                    dep_versions = self._dep_versions(task)
+            except KeyError as e:
+                # tick과 같은 방어 코드: 선행 작업이 없으면 func를 호출하지 않고 실패로 기록
+                task._memo_key = None
+                task.error_message = f"Dependency data not found during execution: {e}"
+                self._finish_run(task, TaskStatus.FAILED, current_run_time)
+                return
+        if started_ns is None:
+            started_ns = time.monotonic_ns()
+        # 최종 상태는 지역 변수에 두고 기록을 모두 마친 뒤에 task.status로 공개한다.
+        # (풀 실행 시 먼저 RUNNING을 풀면 다음 tick이 기록 도중인 작업을 다시 선택할 수 있음)
+        status = TaskStatus.FAILED
         try:
-            # dep_kwargs는 tick 메서드에서 미리 준비하여 전달됨
-            task.result = task.func(*task.args, **{**task.kwargs, **dep_kwargs})
-            task.status = TaskStatus.SUCCESS
-            task.last_success_at = datetime.now() # 성공 시각은 실제 성공 직후 시간
+            # pure 작업의 입력(args/kwargs/선행 작업 결과)이 마지막 성공 때와 같으면 func 호출 없이 result 재사용
+            if not (task.pure and task._memo_key == dep_versions):
+                # dep_kwargs는 tick 메서드에서 미리 준비하여 전달됨
+                call_kwargs = task._call_kwargs
+                if call_kwargs is not None:
+                    # 재사용하는 kwargs 사본의 dep_* 키만 덮어씀. 같은 작업은 RUNNING인 동안 다시 실행되지 않으므로 안전
+                    # (tick은 이미 이 dict 자체에 dep_* 값을 채워서 넘김)
+                    if dep_kwargs is not call_kwargs:
+                        call_kwargs.update(dep_kwargs)
+                    task.result = task._call(**call_kwargs)
+                elif dep_kwargs:
+                    task.result = task._call(**dep_kwargs)  # depends_on 없이 dep_kwargs만 주어진 경우
+                else:
+                    task.result = task._call()  # args/kwargs는 Task 정의 시 partial로 묶어 둠
+                task._result_version += 1
+                task._memo_key = dep_versions
+            # 성공 시각은 실제 성공 직후 시간. 벽시계를 다시 읽지 않고 실행 시각 + tick 이후 경과 시간
+            # (풀 큐에서 기다린 시간 포함)으로 계산
+            # (정수 ns 차이 → 마이크로초 timedelta. float 변환 없이 datetime 해상도에 맞춤)
+            success_at = current_run_time + timedelta(microseconds=(time.monotonic_ns() - started_ns) // 1000)
+            if task.last_success_at is None:
+                self._mark_first_success(task, success_at)  # 의존 작업 카운터 갱신 (lock 사용)
+            else:
+                task.last_success_at = success_at
             task.error_message = None # 성공 시 이전 오류 메시지 클리어
+            status = TaskStatus.SUCCESS
         except Exception as exc:
-            task.status = TaskStatus.FAILED
+            task._memo_key = None
             task.error_message = f"{type(exc).__name__}: {exc}"
             # 필요시 traceback 로깅: import traceback; traceback.print_exc() 또는 logger 사용
         finally:
-            # history 기록
-            # task.last_run_at은 tick에서 설정한 current_run_time 사용
+            self._finish_run(task, status, current_run_time)
+
+    def _finish_run(self, task: Task, status: TaskStatus, run_time: datetime):
+        """
+        실행 하나의 history를 기록하고, 마지막으로 lock 하에서 task.status를 공개한다.
+        tick은 status가 RUNNING이 아닐 때만 작업을 다시 선택하므로, 이 시점 전까지는 이번 실행만 task를 고친다.
+        """
+        # history 기록 (max_history_entries=0이면 항목과 repr 생성 자체를 생략)
+        # history는 maxlen이 있는 deque이므로 오래된 항목은 자동으로 제거됨
+        if task.history.maxlen != 0:
             task.history.append(
-                {
-                    "run_at": current_run_time, # 작업 실행 시작 시각 (tick에서 전달)
-                    "status": task.status,
-                    "result": repr(task.result) if task.status == TaskStatus.SUCCESS else None,
-                    "error": task.error_message if task.status == TaskStatus.FAILED else None,
-                }
+                HistoryEntry(
+                    run_time, # 작업 실행 시작 시각 (tick에서 전달)
+                    status,
+                    # repr은 history를 실제로 읽을 때만 계산 (큰 결과 객체도 실행마다 repr하지 않음).
+                    # record_result_repr이면 기존처럼 실행 시점에 계산
+                    (repr(task.result) if task.record_result_repr else _LazyRepr(task.result))
+                    if status == TaskStatus.SUCCESS else None,
+                    task.error_message if status == TaskStatus.FAILED else None,
+                )
             )
-            # TODO: history 크기 제한 로직 (필요시 Task 모델에 max_history_entries 추가 후 여기서 처리)
+        with self._lock:
+            task.status = status
+
+    def _on_pool_task_done(self, future):
+        """풀에서 작업 하나가 끝나면 자리를 반납하고, 미뤄 둔 작업이 있으면 스케줄러 루프를 깨운다."""
+        with self._lock:
+            self._inflight -= 1
+            has_waiting = bool(self._waiting)
+        if has_waiting:
+            self.wake()
 
     # ── 루프 한 틱마다 호출 ──────────────────────────────────────────
 
     def tick(self):
-        """모든 작업을 검사하고 실행 여부를 판단하여 실행."""
-        now = datetime.now() # 현재 시간은 tick 시작 시 한 번만 가져옴
+        """실행 시각이 된 작업만 힙에서 꺼내 검사하고 실행."""
+        # 상태를 읽기 전에 wake 신호를 지움 → 이후의 변경은 다음 wait_for_next_run이 바로 감지함
+        self._wake.clear()
+        now = self._now() # 현재 시간은 tick 시작 시 한 번만 가져옴
+        now_ns = time.monotonic_ns() # now에 해당하는 monotonic 시각. 실행 성공 시각도 이 값 기준으로 계산
+        self._clock_base = (now, now_ns / 1_000_000_000)
 
-        tasks_to_execute_info = [] # {'task': task_obj, 'dep_kwargs': {}, 'run_time': now} 저장
+        # 한 번의 lock 구간에서 실행할 작업을 모두 골라 (task, dep_kwargs, dep_versions) 튜플로 모아 두고,
+        # lock을 놓은 뒤 한꺼번에 실행/제출한다. 실행 시각은 모두 이번 tick의 now.
+        tasks_to_execute_info: List[Tuple[Task, Dict[str, Any], Optional[Tuple[int, ...]]]] = []
 
-        with self._lock: # store 접근 및 task 상태 초기 변경 보호
-            for task_id in list(self.store.keys()): # 반복 중 store 변경 회피 위해 key 리스트 복사
-                task = self.store.get(task_id)
+        with self._lock: # store/힙 접근 및 task 상태 초기 변경 보호
+            # 선행 작업 대기 중이던 작업 + 실행 예정 시각이 지난 작업이 이번 tick의 후보.
+            # 대기 집합은 복사하지 않고 통째로 넘겨받고, 이번 tick에서 다시 대기할 작업은 새 집합에 넣는다.
+            waiting = self._waiting
+            if waiting:
+                self._waiting = set()
+            else:
+                waiting = ()
+            # 작업마다 반복되는 속성 조회는 지역 변수로 한 번만 바인딩
+            store_get = self.store.get
+            waiting_add = self._waiting.add
+            blocked_add = self._blocked.add
+            check_runnable = self._check_runnable
+            schedule = self._schedule
+            pool = self._pool
+            RUNNING = TaskStatus.RUNNING
+            due_tasks = []
+            heap = self._run_heap
+            while heap and heap[0][0] <= now:
+                run_time, task_id = heapq.heappop(heap)
+                task = store_get(task_id)  # _is_live와 같은 판정이지만 찾은 task를 그대로 사용
+                if task is None or task.next_run_at != run_time:
+                    continue # 일정 갱신/삭제로 무효가 된 항목
+                task.next_run_at = None
+                due_tasks.append(task)
+
+            for task in itertools.chain(map(store_get, waiting), due_tasks):
                 if not task:
-                    # print(f"Warning: Task with id '{task_id}' found in keys but not in store during tick.") # 로거 사용
+                    # 대기 목록에 남아 있던 ID가 store에서 사라진 경우 (직접 store를 조작한 경우 등)
                     continue
 
-                if task.status == TaskStatus.RUNNING: # 이미 다른 tick에서 실행 중으로 표시된 작업은 건너뜀
+                state = check_runnable(task, now)
+
+                if state == _BUSY: # 이미 다른 tick에서 실행 중으로 표시된 작업은 건너뜀
                     # 이것은 task.func가 매우 오래 걸리는 경우, 다음 tick에서 중복 실행 시도를 막기 위함.
                     # 단, 실제 func 실행은 lock 외부이므로, status RUNNING 설정 시점이 중요.
+                    # 힙에서는 빠졌으므로 다음 실행 예정 시각으로 다시 넣어 둔다.
+                    # 실행이 interval보다 길어져 그 시각이 이미 지났다면 힙에 넣지 않고 대기 목록에 둔다.
+                    # (지난 시각으로 넣으면 seconds_until_next_run이 0이 되어 루프가 쉬지 않고 돎)
+                    next_run = self._next_run_time(task, now)
+                    if next_run is not None and next_run <= now:
+                        task.next_run_at = None
+                        waiting_add(task.id)
+                    else:
+                        schedule(task, now)
+                    continue
+
+                if state == _NOT_DUE:
+                    # 외부에서 last_run_at 등이 바뀐 경우. 현재 필드 기준으로 다시 예약.
+                    schedule(task, now)
                     continue
 
-                # 시간 조건 및 의존성 조건 확인 (둘 다 lock 하에서)
-                if self._should_run(task, now) and self._deps_ready(task):
-                    # 실행해야 할 작업으로 결정됨
+                if state == _BLOCKED:
+                    # 시간 조건은 충족했으나 선행 작업 대기 중. 선행 작업이 모두 성공할 때까지 tick에서 제외.
+                    blocked_add(task.id)
+                    continue
 
-                    # 선행 작업 결과 수집 (lock 하에서)
-                    current_dep_kwargs = {}
+                if pool is not None and self._inflight >= self._max_inflight:
+                    # 풀 큐가 가득 참. 실행 시각을 지난 채로 큐에서 기다리게 하지 않고 다음 tick에 다시 검사.
+                    waiting_add(task.id)
+                    continue
+
+                # 실행해야 할 작업으로 결정됨
+
+                # 선행 작업 결과 수집 (lock 하에서). 키 이름과 선행 Task 참조는 미리 만들어 둔 것을 사용.
+                current_dep_kwargs = {}
+                dep_versions = None  # pure 작업만 사용
+                if task.depends_on:
                     try:
-                        for dep_id_needed in task.depends_on:
-                            # _deps_ready가 True를 반환했으므로, 의존성 작업은 존재하고 성공한 적이 있음.
-                            # store.get(dep_id_needed)는 None이 아님을 의미.
-                            dep_task_obj = self.store[dep_id_needed] # 직접 접근 (get 불필요)
-                            current_dep_kwargs[f"dep_{dep_id_needed}"] = dep_task_obj.result
+                        # _deps_ready가 True를 반환했으므로, 의존성 작업은 존재하고 성공한 적이 있음.
+                        dep_refs = self._resolve_dep_refs(task)
                     except KeyError as e:
                         # _deps_ready에서 걸렀어야 하지만, 만약을 위한 방어 코드.
                         # 이 경우, 작업 실행을 건너뛰고 오류 기록.
@@ -165,35 +620,44 @@ class TaskRegistry:
                         task.status = TaskStatus.FAILED # 또는 다른 오류 상태
                         task.error_message = f"Dependency data not found during tick: {e}"
                         task.last_run_at = now # 실행 시도는 있었음
-                        task.history.append({
-                            "run_at": now, "status": task.status, "result": None, "error": task.error_message
-                        })
+                        task.history.append(HistoryEntry(now, task.status, None, task.error_message))
+                        schedule(task, now)
                         continue # 다음 작업으로
+                    # 작업마다 재사용하는 호출 kwargs(kwargs 사본)에 dep_* 값을 바로 채움. 실행마다 새 dict를 만들지 않음.
+                    # 같은 작업은 RUNNING인 동안 다시 선택되지 않으므로 실행 중에 덮어써지지 않음
+                    current_dep_kwargs = task._call_kwargs
+                    if current_dep_kwargs is None:
+                        current_dep_kwargs = {}
+                    for dep_key, dep_task in dep_refs:
+                        current_dep_kwargs[dep_key] = dep_task.result
+                    if task.pure:
+                        dep_versions = tuple(dep_task._result_version for _, dep_task in dep_refs)
+                elif task.pure:
+                    dep_versions = ()
+
+                # 실행 준비 완료. 상태 변경 및 실행 목록에 추가.
+                task.status = RUNNING                # 실행 중 상태로 변경
+                task.last_run_at = now               # 실행 시각 기록 (이번 tick의 now 사용)
+                if task.error_message and task.status != TaskStatus.FAILED: # 이전 오류가 있었으나 이제 실행되므로 초기화
+                    task.error_message = None
+                # last_run_at이 정해졌으므로 다음 실행 예정 시각을 바로 예약.
+                # 실행이 그보다 오래 걸리면 위의 RUNNING 분기에서 다시 미뤄진다.
+                schedule(task, now)
 
-                    # 실행 준비 완료. 상태 변경 및 실행 목록에 추가.
-                    task.status = TaskStatus.RUNNING     # 실행 중 상태로 변경
-                    task.last_run_at = now               # 실행 시각 기록 (이번 tick의 now 사용)
-                    if task.error_message and task.status != TaskStatus.FAILED: # 이전 오류가 있었으나 이제 실행되므로 초기화
-                        task.error_message = None
-
-                    tasks_to_execute_info.append({'task': task, 'dep_kwargs': current_dep_kwargs, 'run_time': now})
-                # else:
-                    # _should_run이 False이거나 _deps_ready가 False인 경우,
-                    # _should_run 내부에서 PENDING으로 설정되었을 수 있음 (만약 그렇게 수정했다면).
-                    # 현재 _should_run은 상태를 변경하지 않으므로, 여기서는 별도 처리 없음.
-                    # PENDING 상태는 "시간 조건은 되었으나 의존성 대기 중" 또는 "다음 실행 대기"로 해석될 수 있음.
-                    # 만약 _should_run이 True인데 _deps_ready가 False이면, PENDING 상태로 두는 것이 적절.
-                    # 이 로직은 tick 시작 시 task.status != RUNNING 조건과 함께 고려.
-                    # if self._should_run(task, now) and not self._deps_ready(task) and task.status != TaskStatus.PENDING :
-                    #    task.status = TaskStatus.PENDING # 의존성 대기 중 명시
-
-        # 잠금 외부에서 실제 작업 함수들 실행
-        for item in tasks_to_execute_info:
-            task_to_run = item['task']
-            dep_kwargs_for_task = item['dep_kwargs']
-            run_time_for_task = item['run_time'] # task.last_run_at과 동일한 값
-
-            # 실제 작업 실행 로직 호출
-            # 이 함수는 task의 status, result, error_message, last_success_at, history를 업데이트함.
-            self._execute_task_logic(task_to_run, dep_kwargs_for_task, run_time_for_task)
+                tasks_to_execute_info.append((task, current_dep_kwargs, dep_versions))
+                if pool is not None:
+                    self._inflight += 1
+
+        # 잠금 외부에서 실제 작업 함수들 실행 (스레드 풀이 있으면 제출만 하고 반환)
+        # 같은 작업은 RUNNING 상태인 동안 다시 선택되지 않으므로 중복 실행되지 않음.
+        # 실제 작업 실행 로직 호출. task의 status, result, error_message, last_success_at, history를 업데이트함.
+        # 실행 시각(now)은 task.last_run_at과 동일한 값
+        if self._pool is not None:
+            pool, on_done = self._pool, self._on_pool_task_done
+            for task_to_run, dep_kwargs_for_task, dep_versions in tasks_to_execute_info:
+                pool.submit(self._execute_task_logic, task_to_run, dep_kwargs_for_task, now,
+                            dep_versions, now_ns).add_done_callback(on_done)
+        else:
+            for task_to_run, dep_kwargs_for_task, dep_versions in tasks_to_execute_info:
+                self._execute_task_logic(task_to_run, dep_kwargs_for_task, now, dep_versions, now_ns)
 
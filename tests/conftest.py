@@ -0,0 +1,27 @@
+"""테스트 모듈들이 함께 쓰는 fixture"""
+import pytest
+import threading
+
+from est_alan_scheduler.scheduler import registry as global_registry, start_scheduler
+
+
+@pytest.fixture
+def run_scheduler():
+    """
+    start_scheduler(blocking=False)를 stop Event와 함께 띄우는 함수를 제공.
+    테스트가 끝나면 루프를 끝내고 스레드를 join (남은 루프가 이후 테스트의 registry를 건드리지 않도록).
+    """
+    stop = threading.Event()
+    threads = []
+
+    def start(interval: float) -> threading.Thread:
+        thread = start_scheduler(interval=interval, blocking=False, stop=stop)
+        threads.append(thread)
+        return thread
+
+    yield start
+    stop.set()
+    global_registry.wake() # 대기 중인 루프를 깨워 바로 stop을 확인하게 함
+    for thread in threads:
+        thread.join(timeout=2.0)
+        assert not thread.is_alive()
@@ -17,8 +17,7 @@ def setup_for_integration_test():
     필요한 patch 등을 설정합니다.
     """
     # 전역 registry 초기화
-    global_registry.store.clear()
-    global_registry._lock = threading.Lock()
+    global_registry.clear() # lock은 교체하지 않음 (registry의 lock은 생성 시의 하나만 사용)
 
     # main.py에서 print가 많이 발생하므로, 테스트 중에는 가로챌 수 있음 (선택)
     # with patch('builtins.print', MagicMock()) as mock_print:
@@ -26,7 +25,7 @@ def setup_for_integration_test():
     yield
 
 
-def test_simple_scheduler_run_with_cli_tasks():
+def test_simple_scheduler_run_with_cli_tasks(run_scheduler):
     """
     cli_main()으로 작업 등록 후, 스케줄러를 짧게 실행하여
     'every' 작업이 실행되고 상태가 업데이트되는지 확인하는 통합 테스트.
@@ -52,7 +51,7 @@ def test_simple_scheduler_run_with_cli_tasks():
     #    주의: cli_main()은 자체적으로 start_scheduler(blocking=True)를 호출하려고 하므로,
     #    위에서 mock 처리함. 여기서는 별도로 start_scheduler를 테스트용으로 호출.
 
-    scheduler_thread = start_scheduler(interval=0.1, blocking=False) # 0.1초마다 tick
+    scheduler_thread = run_scheduler(0.1) # 0.1초마다 tick
     assert scheduler_thread is not None and scheduler_thread.is_alive()
 
     # 'cli_every_7s' 작업은 7초마다 실행.
@@ -87,11 +86,11 @@ def test_simple_scheduler_run_with_cli_tasks():
     assert task_obj.last_run_at > first_run_time, "Task should have run again after its 'every' interval"
     assert task_obj.status == TaskStatus.SUCCESS # func이 성공한다고 가정
 
-    # 스레드 정리는 daemon=True에 의존.
+    # 스레드 정리는 run_scheduler fixture가 담당.
 
 
 @patch('builtins.print') # print 억제
-def test_dependency_chain_in_cli_tasks(mock_print):
+def test_dependency_chain_in_cli_tasks(mock_print, run_scheduler):
     """
     cli_main()으로 등록된 작업 중 의존성('cli_at_daily' on 'cli_every_7s')이
     올바르게 처리되는지 통합 테스트.
@@ -144,7 +143,7 @@ def test_dependency_chain_in_cli_tasks(mock_print):
     # (또는 task_dependent.at 값을 직접 수정 - 하지만 이건 내부 수정이라 권장 안됨)
 
     # 테스트 단순화를 위해, cli_main()을 사용하지 않고 직접 Task를 만들어서 테스트
-    global_registry.store.clear() # 이전 작업들 제거
+    global_registry.clear() # 이전 작업들 제거
 
     mock_dep_func = MagicMock(return_value="Dep Success")
     mock_main_func = MagicMock(return_value="Main Success")
@@ -157,10 +156,12 @@ def test_dependency_chain_in_cli_tasks(mock_print):
         global_registry.register(dep_task)
         global_registry.register(main_task)
 
-        scheduler_thread = start_scheduler(interval=0.5, blocking=False) # 0.5초마다 tick
+        scheduler_thread = run_scheduler(0.5) # 0.5초마다 tick
 
         # 시간 진행 및 상태 확인
+        # 고정 시계를 옮긴 뒤에는 wake()로 대기 중인 루프를 깨워 바로 tick하게 함
         frozen_time.tick(delta=timedelta(seconds=0.6)) # 시간: 10:00:00.6 (tick 1)
+        global_registry.wake()
         # dep_A (10:00:01) 아직, main_B (10:00:02) 아직
         # print_task_statuses("After 0.6s")
         assert dep_task.status == TaskStatus.PENDING
@@ -169,6 +170,7 @@ def test_dependency_chain_in_cli_tasks(mock_print):
         mock_main_func.assert_not_called()
 
         frozen_time.tick(delta=timedelta(seconds=0.5)) # 시간: 10:00:01.1 (tick 2)
+        global_registry.wake()
         # dep_A 실행되어야 함. main_B는 아직 (시간도 안됐고, 의존성도 이제 막 풀릴 것)
         time.sleep(0.1) # 스케줄러가 tick을 처리할 시간 (실제 스레드이므로 약간의 지연 필요)
         # print_task_statuses("After 1.1s")
@@ -178,13 +180,14 @@ def test_dependency_chain_in_cli_tasks(mock_print):
         mock_main_func.assert_not_called()
 
         frozen_time.tick(delta=timedelta(seconds=1.0)) # 시간: 10:00:02.1 (tick 3)
+        global_registry.wake()
         # main_B 실행되어야 함 (시간 도달, 의존성 충족)
         time.sleep(0.1)
         # print_task_statuses("After 2.1s")
         mock_main_func.assert_called_once_with(dep_dep_A="Dep Success") # 의존성 결과 전달 확인
         assert main_task.status == TaskStatus.SUCCESS
 
-        # 스레드 정리 (daemon)
+        # 스레드 정리는 run_scheduler fixture가 담당
 
 def print_task_statuses(header=""): # 디버깅용 헬퍼
     print(f"--- {header} ---")
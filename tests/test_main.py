@@ -1,6 +1,5 @@
 import pytest
 from unittest.mock import patch, MagicMock
-import threading
 from datetime import datetime, timedelta
 
 # main.py에서 사용하는 전역 registry와 start_scheduler를 가져옴
@@ -17,8 +16,7 @@ def reset_global_registry_and_patches():
     import est_alan_scheduler.scheduler # Import here
     original_start_scheduler = est_alan_scheduler.scheduler.start_scheduler
 
-    global_registry.store.clear()
-    global_registry._lock = threading.Lock()
+    global_registry.clear() # lock은 교체하지 않음 (registry의 lock은 생성 시의 하나만 사용)
 
     yield # 테스트 실행
 
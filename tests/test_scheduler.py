@@ -1,5 +1,7 @@
+import ast
+import itertools
+import pathlib
 import pytest
-import time
 import threading
 from unittest.mock import MagicMock, patch
 from datetime import datetime, timedelta
@@ -16,41 +18,59 @@ def reset_global_registry():
     이렇게 하면 테스트 간의 상태 공유를 방지할 수 있습니다.
     scheduler.py의 registry는 전역 변수이므로, 각 테스트가 독립적으로 실행되도록
     내부 store를 비우거나 새 인스턴스로 교체해야 합니다.
-    여기서는 간단히 store를 비우고 lock을 새로 할당합니다.
+    여기서는 registry.clear()로 작업과 스케줄 상태를 빈 컨테이너로 교체합니다.
+    lock은 교체하지 않습니다 (registry의 lock은 생성 시의 하나만 사용).
     """
-    global_registry.store.clear()
-    global_registry._lock = threading.Lock() # Lock도 새로 할당하여 이전 테스트의 영향 제거
+    global_registry.clear()
     yield
-    # 테스트 후 정리 (필요한 경우)
-    # 백그라운드 스레드가 있다면 종료시켜야 할 수 있음 (start_scheduler에서 daemon=True로 해결)
+    # 백그라운드 스케줄러 스레드는 run_scheduler fixture가 종료시킴
 
 
-def test_start_scheduler_non_blocking():
+class _StopLoop(Exception):
+    """blocking 모드의 무한 루프를 테스트에서 끝내기 위한 예외"""
+
+
+def _stop_after(n: int):
+    """n번째 호출에서 _StopLoop을 발생시키는 wait_for_next_run 대용 함수"""
+    calls = itertools.count(1)
+
+    def stop(max_wait):
+        if next(calls) >= n:
+            raise _StopLoop
+    return stop
+
+
+def test_start_scheduler_non_blocking(run_scheduler):
     """start_scheduler(blocking=False)가 백그라운드 스레드에서 tick을 호출하는지 테스트"""
     # registry는 fixture에 의해 초기화됨
-    mock_task_func = MagicMock()
-    task = Task(id="test_bg_task", every={"milliseconds": 100}, func=mock_task_func) # 0.1초 간격
+    # 고정 시간 sleep 대신, 두 번째 호출에서 Event를 set하고 그때까지만 기다림
+    # 호출 횟수만 필요하므로 MagicMock 대신 list.append로 센다 (GIL 하에서 원자적)
+    calls = []
+    ran_twice = threading.Event()
+
+    def task_func():
+        calls.append(1)
+        if len(calls) >= 2:
+            ran_twice.set()
+
+    task = Task(id="test_bg_task", every={"milliseconds": 10}, func=task_func) # 0.01초 간격
     global_registry.register(task)
 
     # start_scheduler는 내부적으로 global_registry를 사용
-    # interval을 매우 짧게 주어 테스트 시간 단축
-    scheduler_thread = start_scheduler(interval=0.05, blocking=False) # 0.05초마다 tick
+    # 루프는 다음 실행 예정 시각(10ms 뒤)에 깨어나므로 interval은 대기 상한일 뿐.
+    # 0으로 두면 대기 시간이 항상 0이 되어, 작업이 두 번 실행되기를 기다리는 동안 루프가 쉬지 않고 돎
+    scheduler_thread = run_scheduler(0.05)
     assert scheduler_thread is not None
     assert isinstance(scheduler_thread, threading.Thread)
     assert scheduler_thread.daemon is True # 주 스레드 종료 시 자동 종료
     assert scheduler_thread.is_alive()
 
-    time.sleep(0.3) # 스케줄러가 몇 번 실행될 시간을 줌 (최소 2-3번 tick 예상)
+    # 스케줄러가 작업을 두 번 실행하는 즉시 반환 (timeout은 실패 시의 상한일 뿐)
+    assert ran_twice.wait(timeout=2.0)
 
-    # mock_task_func가 여러 번 호출되었는지 확인
-    # 정확한 호출 횟수는 타이밍 이슈로 단정하기 어려우므로, 최소 1번 이상 호출되었는지 확인
-    assert mock_task_func.call_count > 1
-
-    # 스케줄러 스레드를 명시적으로 중지하는 기능이 현재 없으므로,
-    # 데몬 스레드에 의존하여 테스트 종료 시 함께 종료되도록 함.
-    # 테스트 환경에서는 스레드가 계속 실행되는 것을 막기 위해
-    # 실제로는 start_scheduler가 스레드 객체를 반환하고, 이를 join하거나
-    # 중단 메커니즘(이벤트 등)을 두는 것이 좋지만, 현재 구현을 기준으로 테스트.
+    # task_func가 여러 번 호출되었는지 확인
+    # 정확한 호출 횟수는 타이밍 이슈로 단정하기 어려우므로, 최소 2번 이상 호출되었는지 확인
+    assert len(calls) > 1
 
     # 전역 registry의 상태를 확인하여 작업이 실행되었는지 볼 수도 있음
     assert global_registry.store["test_bg_task"].last_run_at is not None
@@ -61,57 +81,121 @@ def test_start_scheduler_blocking_mode_calls_tick():
     """start_scheduler(blocking=True)가 tick을 호출하는지 테스트 (mocking 사용)"""
     # blocking=True는 무한 루프에 빠지므로, loop 자체를 mock하여 테스트
 
-    with patch.object(global_registry, 'tick', MagicMock()) as mock_tick:
-        # 루프가 한 번만 실행되고 종료되도록 time.sleep을 mock하여 예외 발생
-        with patch('time.sleep', MagicMock(side_effect=KeyboardInterrupt)):
-            with pytest.raises(KeyboardInterrupt): # KeyboardInterrupt로 루프 탈출 가정
+    # 전역 registry(스레드 풀 사용) 대신 이 테스트 전용 registry를 전역 registry 자리에 넣고 patch함
+    registry = TaskRegistry()
+    with patch('est_alan_scheduler.scheduler.registry', registry), \
+            patch.object(registry, 'tick', MagicMock()) as mock_tick:
+        # 루프가 정확히 3번 돌고 종료되도록 대기 함수를 mock하여 3번째 대기에서 예외 발생
+        with patch.object(registry, 'wait_for_next_run', MagicMock(side_effect=_stop_after(3))):
+            with pytest.raises(_StopLoop):
                 start_scheduler(interval=0.01, blocking=True)
 
-    mock_tick.assert_called() # tick이 한 번 이상 호출되었어야 함
+    assert mock_tick.call_count == 3 # 대기 전마다 tick 한 번
 
 
-@patch('est_alan_scheduler.scheduler.TaskRegistry', spec=TaskRegistry) # TaskRegistry 인스턴스 생성을 mock
-def test_start_scheduler_uses_global_registry_instance(MockTaskRegistry):
-    """start_scheduler가 전역 'registry' 인스턴스를 사용하는지 확인"""
+def test_start_scheduler_blocking_runs_due_tasks_on_frozen_time():
+    """start_scheduler(blocking=True): 대기 대신 가상 시간을 150ms씩 진행시켜 실행 횟수를 정확히 검증"""
+    registry = TaskRegistry() # 풀 없이 tick 안에서 바로 실행 → 호출 횟수가 결정적
+    mock_task_func = MagicMock()
 
-    # start_scheduler를 호출하면 내부적으로 registry.tick()을 사용해야 함
-    # 전역 registry를 우리가 만든 mock_registry로 교체해야 함
+    with freeze_time("2024-01-01 00:00:00") as frozen:
+        registry.register(Task(id="virtual", every={"milliseconds": 300}, func=mock_task_func))
+        stop = _stop_after(7) # tick 7번 (0ms ~ 900ms) 후 루프 탈출
 
-    mock_registry_instance = MockTaskRegistry.return_value # 생성자 호출 시 반환될 mock 객체
+        def advance(max_wait):
+            stop(max_wait)
+            frozen.tick(timedelta(milliseconds=150))
+
+        with patch('est_alan_scheduler.scheduler.registry', registry), \
+                patch.object(registry, 'wait_for_next_run', MagicMock(side_effect=advance)):
+            with pytest.raises(_StopLoop):
+                start_scheduler(interval=1.0, blocking=True)
+
+    # 0, 300, 600, 900ms에 실행
+    assert mock_task_func.call_count == 4
+    assert registry.store["virtual"].last_run_at == datetime(2024, 1, 1, 0, 0, 0, 900000)
+
+
+def test_scheduler_loop_runs_dependent_as_soon_as_pool_dependency_succeeds():
+    """
+    start_scheduler: 풀에서 선행 작업이 처음 성공하며 보낸 wake를 놓치지 않고, interval을 기다리지 않고 의존 작업을 실행.
+    선행 작업의 wake가 tick이 끝나기 전에 도착하도록 첫 tick을 그때까지 붙잡아 둔다 (가장 놓치기 쉬운 순서).
+    """
+    registry = TaskRegistry(max_workers=2)
+    now = datetime.now()
+    dependent_ran = threading.Event()
+    registry.register(Task(id="dep", run_at=now, func=lambda: "dep result"))
+    registry.register(Task(id="main", run_at=now, func=lambda dep_dep: dependent_ran.set(), depends_on=["dep"]))
+
+    dep_woke = threading.Event()
+    real_wake, real_tick = registry.wake, registry.tick
+
+    def wake():
+        real_wake()
+        dep_woke.set()
+
+    def tick():
+        real_tick()
+        if not dep_woke.is_set():
+            assert dep_woke.wait(timeout=2.0) # 첫 tick: 선행 작업이 풀에서 끝나고 wake를 보낼 때까지
+
+    stop = threading.Event()
+    with patch('est_alan_scheduler.scheduler.registry', registry), \
+            patch.object(registry, 'wake', wake), patch.object(registry, 'tick', tick):
+        thread = start_scheduler(interval=5.0, blocking=False, stop=stop)
+        try:
+            assert dependent_ran.wait(timeout=1.0) # wake를 놓치면 interval(5초)이 지나야 실행됨
+        finally:
+            stop.set()
+            real_wake()
+            thread.join(timeout=2.0)
+            registry.shutdown()
+    assert not thread.is_alive()
+
+
+class _StubRegistry:
+    """start_scheduler 루프가 쓰는 두 메서드만 가진 registry 대역 (spec MagicMock보다 가벼움)"""
+
+    def __init__(self, waits_before_stop: int):
+        self.tick_calls = 0
+        self.wait_for_next_run = _stop_after(waits_before_stop)
+
+    def tick(self):
+        self.tick_calls += 1
+
+
+def test_start_scheduler_uses_global_registry_instance():
+    """start_scheduler가 전역 'registry' 인스턴스를 사용하는지 확인"""
+    # 원래 scheduler 모듈의 전역 registry를 stub으로 패치. 루프는 stub의 tick()을 호출해야 함
+    stub = _StubRegistry(waits_before_stop=1)
+    with patch('est_alan_scheduler.scheduler.registry', stub):
+        with pytest.raises(_StopLoop):
+            start_scheduler(interval=0.01, blocking=True)
+
+    assert stub.tick_calls == 1
 
-    # 원래 scheduler 모듈의 전역 registry를 mock_registry_instance로 패치
-    with patch('est_alan_scheduler.scheduler.registry', mock_registry_instance):
-        with patch('time.sleep', MagicMock(side_effect=KeyboardInterrupt)):
-            with pytest.raises(KeyboardInterrupt):
-                start_scheduler(interval=0.01, blocking=True)
 
-    mock_registry_instance.tick.assert_called()
+# scheduler.py가 `python -m est_alan_scheduler.scheduler` 등으로 직접 실행될 때의 동작 검증.
+# runpy로 모듈을 다시 실행하면 전역 registry(와 스레드 풀)가 새로 만들어지므로 소스를 AST로 검사함.
 
+def _is_main_guard(node: ast.stmt) -> bool:
+    """`if __name__ == "__main__":` 형태의 문장인지"""
+    if not isinstance(node, ast.If) or not isinstance(node.test, ast.Compare):
+        return False
+    operands = [node.test.left, *node.test.comparators]
+    has_name = any(isinstance(op, ast.Name) and op.id == "__name__" for op in operands)
+    has_main = any(isinstance(op, ast.Constant) and op.value == "__main__" for op in operands)
+    return has_name and has_main
 
-# scheduler.py의 if __name__ == "__main__": 블록 내 로직 테스트
-# 이 부분은 통합 테스트 성격이 강하며, 직접 실행되는 코드의 동작을 검증.
-# 여기서는 해당 블록의 핵심 로직(작업 등록 및 스케줄러 시작)을 가져와 테스트.
-# 실제로는 main 함수를 별도로 분리하여 단위 테스트하는 것이 더 일반적임.
-# 여기서는 해당 블록이 `python -m est_alan_scheduler.scheduler` 등으로 실행될 때의 동작을 가정.
 
-@patch('est_alan_scheduler.scheduler.start_scheduler') # est_alan_scheduler.scheduler 모듈의 start_scheduler를 mock
-@patch('builtins.print') # print 호출을 가로챔 (선택적)
-def test_scheduler_module_does_not_auto_start_when_run_as_main(mock_print, mock_start_scheduler_in_scheduler_module):
+def test_scheduler_module_does_not_auto_start_when_run_as_main():
     """
-    scheduler.py를 직접 실행해도 (__main__ 블록이 없으므로)
-    start_scheduler가 자동으로 호출되지 않음을 테스트합니다.
-    mock_start_scheduler_in_scheduler_module는 est_alan_scheduler.scheduler.start_scheduler의 mock입니다.
+    scheduler.py에는 __main__ 블록이 없으므로 직접 실행해도 start_scheduler가 자동으로 호출되지 않음.
+    모듈을 다시 실행하지 않고(전역 registry 재생성 등 부작용 없음) 소스의 최상위 문장만 검사합니다.
     """
-    import runpy
-    try:
-        # scheduler.py를 __main__으로 실행합니다.
-        # 이 모듈 내에서 start_scheduler가 호출되면 mock_start_scheduler_in_scheduler_module이 사용됩니다.
-        runpy.run_module("est_alan_scheduler.scheduler", run_name="__main__", init_globals=None)
-    except Exception as e:
-        pytest.fail(f"runpy.run_module for est_alan_scheduler.scheduler failed unexpectedly: {e}")
-
-    # scheduler.py 내에 __main__ 블록이 없으므로, start_scheduler는 호출되지 않아야 합니다.
-    mock_start_scheduler_in_scheduler_module.assert_not_called()
+    import est_alan_scheduler.scheduler as scheduler_module
+    tree = ast.parse(pathlib.Path(scheduler_module.__file__).read_text(encoding="utf-8"))
+    assert not any(_is_main_guard(node) for node in tree.body)
 
 
 # freeze_time을 fixture로 사용하여 테스트 전체에 적용하거나, 특정 테스트에만 컨텍스트 매니저로 사용
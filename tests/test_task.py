@@ -1,8 +1,13 @@
+import re
 import pytest
+from unittest.mock import MagicMock
 from pydantic import ValidationError
 from datetime import datetime, timedelta
 
-from est_alan_scheduler.task import Task, TaskStatus
+from est_alan_scheduler.task import HistoryEntry, Task, TaskStatus
+
+_UUID4_HEX = re.compile(r"[0-9a-f]{12}4[0-9a-f]{3}[89ab][0-9a-f]{15}")  # uuid4().hex 형식 (버전/variant 자리 포함)
+_NOOP = lambda: None  # 아무 일도 하지 않는 공용 작업 함수 (테스트마다 lambda를 새로 만들지 않음)
 
 def test_task_creation_with_every_schedule():
     """'every' 스케줄 옵션으로 Task 생성 테스트"""
@@ -20,7 +25,7 @@ def test_task_creation_with_every_schedule():
     assert task.last_run_at is None
     assert task.result is None
     assert task.error_message is None
-    assert task.history == []
+    assert list(task.history) == []
 
 def test_task_creation_with_at_schedule():
     """'at' 스케줄 옵션으로 Task 생성 테스트"""
@@ -47,11 +52,11 @@ def test_task_creation_with_custom_id():
 
 def test_task_id_auto_generation():
     """Task ID 자동 생성 테스트"""
-    task1 = Task(every={"seconds": 5}, func=lambda: 1)
-    task2 = Task(every={"seconds": 5}, func=lambda: 2)
-    assert task1.id != task2.id
-    assert isinstance(task1.id, str)
-    assert len(task1.id) == 32 # UUID4 hex
+    tasks = [Task(every={"seconds": 5}, func=_NOOP) for _ in range(10)]
+    assert len({task.id for task in tasks}) == len(tasks) # 모두 서로 다름
+    for task in tasks:
+        assert isinstance(task.id, str)
+        assert _UUID4_HEX.fullmatch(task.id) is not None # UUID4 hex (32자리 소문자 16진수)
 
 def test_task_creation_with_args_and_kwargs():
     """args 및 kwargs를 포함한 Task 생성 테스트"""
@@ -68,55 +73,102 @@ def test_task_creation_with_args_and_kwargs():
     assert task.kwargs == {"c": 3}
     # 실제 함수 실행은 TaskRegistry에서 테스트
 
-def test_task_at_format_validation():
-    """'at' 필드 형식 유효성 검사 테스트"""
-    with pytest.raises(ValidationError) as excinfo:
-        Task(at="25:00", func=lambda: print("Invalid time"))
-    assert "at field must be in HH:MM format" in str(excinfo.value)
-
-    with pytest.raises(ValidationError) as excinfo:
-        Task(at="10:30:00", func=lambda: print("Invalid time")) # 초 포함 불가
-    assert "at field must be in HH:MM format" in str(excinfo.value)
+@pytest.mark.parametrize("bad_at", [
+    "25:00",     # 범위를 벗어난 시
+    "10:30:00",  # 초 포함 불가
+    "10-30",     # 구분자 오류
+])
+def test_task_at_format_rejected(bad_at):
+    """'at' 필드 형식 유효성 검사: 잘못된 형식은 거부"""
+    with pytest.raises(ValidationError, match="at field must be in HH:MM format"):
+        Task(at=bad_at, func=_NOOP)
 
-    with pytest.raises(ValidationError) as excinfo:
-        Task(at="10-30", func=lambda: print("Invalid time")) # 구분자 오류
-    assert "at field must be in HH:MM format" in str(excinfo.value)
 
-    # 유효한 형식
-    task_valid = Task(at="09:00", func=lambda: print("Valid time"))
-    assert task_valid.at == "09:00"
-    task_valid_pm = Task(at="23:59", func=lambda: print("Valid time PM"))
-    assert task_valid_pm.at == "23:59"
+@pytest.mark.parametrize("valid_at", ["09:00", "23:59"])
+def test_task_at_format_accepted(valid_at):
+    """'at' 필드 형식 유효성 검사: 유효한 형식은 그대로 보관"""
+    assert Task(at=valid_at, func=_NOOP).at == valid_at
 
 
-def test_task_every_keys_validation():
-    """'every' 필드 키 유효성 검사 테스트"""
-    with pytest.raises(ValidationError) as excinfo:
-        Task(every={"minutesss": 5}, func=lambda: print("Invalid key")) # 오타
-    assert "Invalid key 'minutesss' in 'every' field" in str(excinfo.value)
+@pytest.mark.parametrize("bad_every, message", [
+    ({"minutesss": 5}, "Invalid key 'minutesss' in 'every' field"),  # 오타
+    ({}, "'every' field cannot be an empty dictionary"),             # 빈 딕셔너리
+])
+def test_task_every_keys_rejected(bad_every, message):
+    """'every' 필드 키 유효성 검사: 허용되지 않은 키나 빈 딕셔너리는 거부"""
+    with pytest.raises(ValidationError, match=message):
+        Task(every=bad_every, func=_NOOP)
 
-    with pytest.raises(ValidationError) as excinfo:
-        Task(every={}, func=lambda: print("Empty dict")) # 빈 딕셔너리
-    assert "'every' field cannot be an empty dictionary" in str(excinfo.value)
 
-    # 유효한 키
-    task_valid_every = Task(every={"days": 1, "hours": 2, "minutes": 30, "seconds": 15}, func=lambda: print("Valid"))
+def test_task_every_keys_accepted():
+    """'every' 필드 키 유효성 검사: 유효한 키 조합은 그대로 보관"""
+    task_valid_every = Task(every={"days": 1, "hours": 2, "minutes": 30, "seconds": 15}, func=_NOOP)
     assert task_valid_every.every == {"days": 1, "hours": 2, "minutes": 30, "seconds": 15}
 
-def test_task_default_status_is_pending():
-    """Task의 기본 상태가 PENDING인지 확인"""
-    task = Task(every={"seconds": 1}, func=lambda: None)
-    assert task.status == TaskStatus.PENDING
-
-def test_task_optional_fields_default_to_none_or_empty():
-    """선택적 필드들의 기본값 확인"""
-    task = Task(every={"seconds": 1}, func=lambda: None)
-    assert task.last_success_at is None
-    assert task.last_run_at is None
-    assert task.result is None
-    assert task.error_message is None
-    assert task.history == []
-    assert task.depends_on == []
+def test_task_runtime_fields_default_values():
+    """기본 상태는 PENDING이고, 선택적 런타임 필드는 None 또는 빈 값 (Task 하나로 한 번에 확인)"""
+    task = Task(every={"seconds": 1}, func=_NOOP)
+    expected = {
+        "status": TaskStatus.PENDING,
+        "last_success_at": None,
+        "last_run_at": None,
+        "result": None,
+        "error_message": None,
+        "history": [],
+        "depends_on": [],
+    }
+    actual = {attr: getattr(task, attr) for attr in expected}
+    actual["history"] = list(actual["history"])
+    assert actual == expected # 실패 시 어떤 필드가 다른지 dict 비교로 표시됨
+
+def test_task_mutable_defaults_are_not_shared():
+    """kwargs/depends_on/history 기본값은 인스턴스마다 새로 생성됨"""
+    task1 = Task(every={"seconds": 1}, func=lambda: None)
+    task2 = Task(every={"seconds": 1}, func=lambda: None)
+    task1.kwargs["a"] = 1
+    task1.depends_on.append("dep")
+    task1.history.append({"status": TaskStatus.SUCCESS})
+    assert task2.kwargs == {}
+    assert task2.depends_on == []
+    assert list(task2.history) == []
+
+def test_task_history_is_bounded():
+    """history는 max_history_entries개까지만 보관 (오래된 항목부터 제거)"""
+    task = Task(every={"seconds": 1}, func=lambda: None, max_history_entries=3)
+    for i in range(5):
+        task.history.append({"run": i})
+    assert [entry["run"] for entry in task.history] == [2, 3, 4]
+
+    # 기본값은 50개, list로 전달해도 같은 제한이 적용됨
+    default_task = Task(every={"seconds": 1}, func=lambda: None, history=[{"run": 0}])
+    assert default_task.history.maxlen == 50
+    assert list(default_task.history) == [{"run": 0}]
+
+    # 0이면 기록하지 않음
+    silent_task = Task(every={"seconds": 1}, func=lambda: None, max_history_entries=0)
+    silent_task.history.append({"run": 0})
+    assert len(silent_task.history) == 0
+
+def test_task_caches_derived_fields():
+    """at/every 파싱 결과, dep kwargs 키, 호출용 partial이 Task에 캐시되고, update 시 갱신되는지 확인"""
+    func = MagicMock()
+    task = Task(at="07:05", func=func, args=(1,), kwargs={"c": 3}, depends_on=["a"])
+    assert task._at_hm == (7, 5)
+    assert task._every_delta is None
+    assert task._dep_kwarg_keys == ("dep_a",)
+    assert task._call_kwargs == {"c": 3} # 선행 작업이 있으면 kwargs는 재사용 dict로 전달
+    task._call(**task._call_kwargs, dep_a="x")
+    func.assert_called_once_with(1, c=3, dep_a="x")
+
+    new_func = MagicMock()
+    task.update(Task(every={"minutes": 2}, func=new_func, depends_on=["b", "c"]))
+    assert task._at_hm is None
+    assert task._every_delta == timedelta(minutes=2)
+    assert task._dep_kwarg_keys == ("dep_b", "dep_c")
+    assert task._call_kwargs == {}
+    task._call()
+    new_func.assert_called_once_with()
+    assert Task(at="07:05", func=func)._call_kwargs is None # 선행 작업이 없으면 kwargs까지 partial에 묶음
 
 # Task 모델 자체는 스케줄 옵션 중 하나만 존재해야 한다는 것을 강제하지 않음.
 # 이는 TaskRegistry의 register 메서드에서 검증함.
@@ -144,6 +196,38 @@ def test_task_creation_no_schedule_options_allowed_initially():
     except ValidationError:
         pytest.fail("Task model itself should allow no schedule options; validation is in TaskRegistry")
 
+def test_task_status_is_int_enum_with_readable_str():
+    """TaskStatus: 정수 값으로 비교하고, 출력 시에는 소문자 이름 사용"""
+    assert TaskStatus.SUCCESS == 2
+    assert str(TaskStatus.SUCCESS) == "success"
+    assert f"{TaskStatus.FAILED}" == "failed"
+
+
+def test_task_schedule_kind_follows_schedule_option():
+    """Task: 지정된 스케줄 옵션에 따라 _schedule_kind가 정해지고, update 시 갱신됨"""
+    task = Task(every={"seconds": 10}, func=lambda: None)
+    assert task._schedule_kind == "every"
+    task.update(Task(id=task.id, at="10:30", func=lambda: None))
+    assert task._schedule_kind == "at"
+    assert Task(run_at=datetime.now(), func=lambda: None)._schedule_kind == "run_at"
+    assert Task(func=lambda: None)._schedule_kind is None
+
+
+def test_history_entry_slots_and_mapping_access():
+    """HistoryEntry: 슬롯 클래스이지만 기존 dict 항목처럼 키로 읽고 비교할 수 있음"""
+    run_at = datetime(2024, 7, 15, 10, 0, 0)
+    entry = HistoryEntry(run_at, TaskStatus.FAILED, None, "ValueError: boom")
+
+    assert not hasattr(entry, "__dict__")
+    assert entry["run_at"] == entry.run_at == run_at
+    assert entry["error"] == "ValueError: boom"
+    with pytest.raises(KeyError):
+        entry["missing"]
+    assert entry == {"run_at": run_at, "status": TaskStatus.FAILED, "result": None, "error": "ValueError: boom"}
+
+    task = Task(every={"seconds": 1}, func=lambda: None, history=[entry])
+    assert task.history_records() == [entry._asdict()]
+
 # 참고: Task 모델은 Pydantic 모델이므로, 필드 타입이 맞지 않으면 ValidationError가 발생.
 # 예를 들어 'every'에 문자열을 넣거나, 'func'에 정수를 넣는 등의 테스트는
 # Pydantic의 기본 동작이므로 여기서는 명시적으로 모든 케이스를 다루지 않음.
@@ -1,9 +1,12 @@
 import pytest
+import sys
+import threading
 from datetime import datetime, timedelta, time as dtime
-from unittest.mock import MagicMock, call
+from typing import Any, List, Optional, Tuple
+from unittest.mock import MagicMock, call, patch
 from freezegun import freeze_time
 
-from est_alan_scheduler.task import Task, TaskStatus
+from est_alan_scheduler.task import HistoryEntry, Task, TaskStatus
 from est_alan_scheduler.task_registry import TaskRegistry
 
 # 헬퍼 함수
@@ -41,11 +44,79 @@ def create_mock_task(**kwargs):
     return Task(**final_params)
 
 
-@pytest.fixture
-def registry():
-    """테스트를 위한 새로운 TaskRegistry 인스턴스를 제공합니다."""
+class Spy:
+    """
+    호출 인자만 기록하는 가벼운 작업 함수 대역. 호출 여부/인자만 확인하는 tick 테스트에서 MagicMock 대신 사용.
+    (MagicMock은 호출마다 mock_calls 등 부가 정보를 기록하므로 훨씬 느림)
+    """
+
+    __slots__ = ("calls", "result", "side_effect")
+
+    def __init__(self, result: Any = None, side_effect: Optional[BaseException] = None):
+        self.calls: List[Tuple[tuple, dict]] = []
+        self.result = result
+        self.side_effect = side_effect
+
+    def __call__(self, *args, **kwargs):
+        self.calls.append((args, kwargs))
+        if self.side_effect is not None:
+            raise self.side_effect
+        return self.result
+
+    @property
+    def call_count(self) -> int:
+        return len(self.calls)
+
+    def assert_not_called(self):
+        assert self.calls == []
+
+    def assert_called_once(self):
+        assert len(self.calls) == 1, self.calls
+
+    def assert_called_once_with(self, *args, **kwargs):
+        assert self.calls == [(args, kwargs)]
+
+    def assert_called_with(self, *args, **kwargs):
+        assert self.calls and self.calls[-1] == (args, kwargs), self.calls
+
+
+@pytest.fixture(scope="session")
+def _session_registry():
+    """테스트 세션 전체에서 공유하는 TaskRegistry (스레드 풀 없음)."""
     return TaskRegistry()
 
+
+@pytest.fixture
+def registry(_session_registry):
+    """테스트를 위한 빈 TaskRegistry. 매번 새로 만들지 않고 공유 인스턴스를 clear()해서 제공합니다."""
+    _session_registry.clear()
+    _session_registry._wake.clear()
+    return _session_registry
+
+
+class ManualClock:
+    """TaskRegistry(clock=...)에 넣는 수동 시계. freezegun 없이 registry가 보는 시각만 정함."""
+
+    def __init__(self, now: datetime):
+        self.now = now
+
+    def __call__(self) -> datetime:
+        return self.now
+
+    def advance(self, **delta):
+        self.now += timedelta(**delta)
+
+
+@pytest.fixture
+def clock():
+    return ManualClock(datetime(2024, 7, 15, 10, 0, 0))
+
+
+@pytest.fixture
+def clocked_registry(clock):
+    """clock fixture의 시각으로 동작하는 TaskRegistry"""
+    return TaskRegistry(clock=clock)
+
 # ─────────────────────────── register 메서드 테스트 ───────────────────────────────
 
 def test_register_task_success(registry: TaskRegistry):
@@ -72,6 +143,18 @@ def test_register_task_multiple_schedule_options_fail(registry: TaskRegistry):
     with pytest.raises(ValueError, match="Task must specify exactly one of every / at / run_at"):
         registry.register(task_multiple_schedule)
 
+@pytest.mark.parametrize("options", [
+    {"every": {"seconds": 1}, "run_at": datetime(2024, 7, 15, 10, 0, 0)},
+    {"at": "10:00", "run_at": datetime(2024, 7, 15, 10, 0, 0)},
+    {"every": {"seconds": 1}, "at": "10:00", "run_at": datetime(2024, 7, 15, 10, 0, 0)},
+])
+def test_check_schedule_options_rejects_every_combination(options):
+    """_check_schedule_options: 두 개 이상의 어떤 조합도 거부하고, 하나만 있으면 통과"""
+    with pytest.raises(ValueError, match="exactly one of every / at / run_at"):
+        TaskRegistry._check_schedule_options(Task(func=lambda: None, **options))
+    for key, value in options.items():
+        TaskRegistry._check_schedule_options(Task(func=lambda: None, **{key: value}))
+
 def test_register_duplicate_task_id_fails(registry: TaskRegistry):
     """중복 ID로 작업 등록 시 ValueError 발생 테스트"""
     task1 = create_mock_task(id="duplicate_id", every={"seconds": 5})
@@ -80,6 +163,60 @@ def test_register_duplicate_task_id_fails(registry: TaskRegistry):
     with pytest.raises(ValueError, match="Task with id 'duplicate_id' already registered."):
         registry.register(task2)
 
+def test_tasks_snapshot_is_stable_during_delete(registry: TaskRegistry):
+    """tasks(): 스냅샷을 순회하면서 delete해도 안전"""
+    for task_id in ("a", "b", "c"):
+        registry.register(create_mock_task(id=task_id, every={"seconds": 5}))
+
+    snapshot = registry.tasks()
+    for task in snapshot:
+        if task.id != "b":
+            registry.delete(task.id)
+
+    assert [task.id for task in snapshot] == ["a", "b", "c"] # 기존 스냅샷은 그대로
+    assert [task.id for task in registry.tasks()] == ["b"]
+
+def test_register_interns_task_id_and_dependency_keys(registry: TaskRegistry):
+    """register: 동적으로 만든 ID 문자열도 intern되어 depends_on/dep_* 키와 같은 객체를 공유"""
+    dep_id = "".join(["dyn", "_dep"]) # 런타임에 만든 (intern되지 않은) 문자열
+    dep_task = registry.register(create_mock_task(id=dep_id, every={"seconds": 5}))
+    main_task = registry.register(create_mock_task(id="main", every={"seconds": 5}, depends_on=["".join(["dyn", "_dep"])]))
+
+    assert dep_task.id is sys.intern("dyn_dep")
+    assert main_task.depends_on[0] is dep_task.id
+    assert main_task._dep_kwarg_keys[0] is sys.intern("dep_dyn_dep")
+
+def test_delete_unknown_task_id_is_noop(registry: TaskRegistry):
+    """delete: 없는 ID는 예외 없이 무시하고 스냅샷도 바꾸지 않음 (lock도 잡지 않음)"""
+    registry.register(create_mock_task(id="a", every={"seconds": 5}))
+    snapshot = registry.tasks()
+    registry._wake.clear()
+
+    # lock을 교체하지 않고 테스트가 직접 잡아 둔 채 delete. lock을 기다리면 시간 안에 끝나지 않음
+    deleter = threading.Thread(target=registry.delete, args=("missing",))
+    with registry._lock:
+        deleter.start()
+        deleter.join(timeout=1.0)
+        assert not deleter.is_alive() # 없는 ID는 lock 없이 반환
+    assert not registry._wake.is_set() # 바뀐 것이 없으므로 스케줄러 루프도 깨우지 않음
+
+    assert registry.tasks() is snapshot
+    assert list(registry.store) == ["a"]
+
+def test_clear_removes_tasks_and_schedule(registry: TaskRegistry):
+    """clear: store, 힙, 스냅샷, 대기 목록과 tick 시각 기준을 모두 비우고 스케줄러 루프를 깨움 (공유 registry fixture가 의존)"""
+    registry.register(create_mock_task(id="a", every={"seconds": 5}))
+    registry.register(create_mock_task(id="b", every={"seconds": 5}, depends_on=["missing"]))
+    registry.tick()
+    assert registry._blocked == {"b"}
+    registry.clear()
+    assert registry._wake.is_set() # register/update/delete처럼 스케줄러 루프를 깨움
+    assert registry.store == {}
+    assert registry.tasks() == ()
+    assert not registry._blocked and not registry._waiting and not registry._dependents
+    assert registry._clock_base is None
+    assert registry.seconds_until_next_run(3.0) == 3.0
+
 # ─────────────────────────── _deps_ready 메서드 테스트 ────────────────────────────
 # _deps_ready는 lock 하에서 호출되므로, 테스트 시 store를 직접 조작
 
@@ -132,76 +269,208 @@ def test_deps_ready_multiple_dependencies_all_succeeded(registry: TaskRegistry):
 # ─────────────────────────── _should_run 메서드 테스트 ────────────────────────────
 # _should_run은 lock 하에서 호출되므로, 테스트 시 store를 직접 조작하거나 task 객체만 전달
 
-@freeze_time("2024-07-15 10:00:00")
-def test_should_run_run_at_task(registry: TaskRegistry):
-    """_should_run: run_at 작업 테스트"""
-    # 지정 시간 전
-    task_before = create_mock_task(run_at=datetime(2024, 7, 15, 10, 0, 1))
-    assert registry._should_run(task_before, datetime.now()) is False
-
-    # 지정 시간 정각
-    task_on_time = create_mock_task(run_at=datetime(2024, 7, 15, 10, 0, 0))
-    assert registry._should_run(task_on_time, datetime.now()) is True
-
-    # 지정 시간 후
-    task_after = create_mock_task(run_at=datetime(2024, 7, 15, 9, 59, 59))
-    assert registry._should_run(task_after, datetime.now()) is True
-
-    # 이미 실행 시도된 경우 (last_run_at 설정됨)
-    task_already_run = create_mock_task(run_at=datetime(2024, 7, 15, 9, 0, 0), last_run_at=datetime(2024,7,15, 9,0,5))
-    assert registry._should_run(task_already_run, datetime.now()) is False
-
-@freeze_time("2024-07-15 10:00:00") # 현재 시각 10:00:00
-def test_should_run_at_task(registry: TaskRegistry):
-    """_should_run: at 작업 테스트"""
-    now = datetime.now() # 2024-07-15 10:00:00
-
-    # 지정 시간 전 (오늘)
-    task_before = create_mock_task(at="10:01") # 오늘 10:01:00
-    assert registry._should_run(task_before, now) is False
-
-    # 지정 시간 정각 (오늘)
-    task_on_time = create_mock_task(at="10:00") # 오늘 10:00:00
-    assert registry._should_run(task_on_time, now) is True
-
-    # 지정 시간 후 (오늘)
-    task_after = create_mock_task(at="09:59") # 오늘 09:59:00
-    assert registry._should_run(task_after, now) is True
-
-    # 오늘 이미 실행된 경우
-    task_run_today = create_mock_task(at="09:00", last_run_at=now.replace(hour=9, minute=0, second=5))
-    assert registry._should_run(task_run_today, now) is False # 09:00에 실행했으므로, 10:00에는 다시 실행 안함
-
-    # 어제 실행된 경우 (오늘 아직 실행 안됨)
-    task_run_yesterday = create_mock_task(at="10:00", last_run_at=now - timedelta(days=1))
-    assert registry._should_run(task_run_yesterday, now) is True
-
-    # 시간이 00:00 이고, last_run_at이 어제인 경우
-    with freeze_time("2024-07-15 00:00:00"):
-        now_midnight = datetime.now()
-        task_at_midnight = create_mock_task(at="00:00", last_run_at=now_midnight - timedelta(days=1))
-        assert registry._should_run(task_at_midnight, now_midnight) is True
+_NOW = datetime(2024, 7, 15, 10, 0, 0) # clock fixture의 시각
+
+@pytest.mark.parametrize("kwargs,last,expected", [
+    # run_at: 지정 시간 전 / 정각 / 후 / 이미 실행 시도됨
+    ({"run_at": _NOW + timedelta(seconds=1)}, None, False),
+    ({"run_at": _NOW}, None, True),
+    ({"run_at": _NOW - timedelta(seconds=1)}, None, True),
+    ({"run_at": _NOW - timedelta(hours=1)}, _NOW - timedelta(minutes=59, seconds=55), False),
+    # at: 오늘 지정 시간 전 / 정각 / 후 / 오늘 이미 실행 / 어제 실행
+    ({"at": "10:01"}, None, False),
+    ({"at": "10:00"}, None, True),
+    ({"at": "09:59"}, None, True),
+    ({"at": "09:00"}, _NOW.replace(hour=9, second=5), False),
+    ({"at": "10:00"}, _NOW - timedelta(days=1), True),
+    # every: 첫 실행 / 간격 경과 전 / 정각 / 후
+    ({"every": {"seconds": 10}}, None, True),
+    ({"every": {"seconds": 10}}, _NOW - timedelta(seconds=5), False),
+    ({"every": {"seconds": 10}}, _NOW - timedelta(seconds=10), True),
+    ({"every": {"seconds": 10}}, _NOW - timedelta(seconds=15), True),
+])
+def test_should_run(registry: TaskRegistry, clock, kwargs, last, expected):
+    """_should_run: run_at / at / every 작업의 실행 여부 판단"""
+    task = create_mock_task(**kwargs, last_run_at=last)
+    assert registry._should_run(task, clock()) is expected
+
+def test_should_run_at_task_at_midnight(registry: TaskRegistry, clock):
+    """_should_run: 00:00 정각에 어제 실행된 at="00:00" 작업은 실행 대상"""
+    clock.now = datetime(2024, 7, 15, 0, 0, 0)
+    task = create_mock_task(at="00:00", last_run_at=clock() - timedelta(days=1))
+    assert registry._should_run(task, clock()) is True
+
+def test_update_refreshes_cached_schedule_fields(registry: TaskRegistry):
+    """update: 캐시된 at/every 값(오늘의 at 실행 시각 포함)이 새 정의로 갱신됨"""
+    now = datetime(2024, 7, 15, 10, 0, 0)
+    task = registry.register(create_mock_task(id="task", at="10:30"))
+    assert registry._should_run(task, now) is False # 오늘의 실행 시각(10:30)이 캐시됨
+
+    registry.update(create_mock_task(id="task", at="09:00"))
+    assert registry._should_run(task, now) is True
+
+    registry.update(create_mock_task(id="task", every={"minutes": 5}))
+    task.last_run_at = now
+    assert registry._should_run(task, now + timedelta(minutes=4)) is False
+    assert registry._should_run(task, now + timedelta(minutes=5)) is True
+
+
+def test_should_run_at_task_does_not_parse_at_string(registry: TaskRegistry):
+    """_should_run / _next_run_time: at 문자열은 Task 생성 시 한 번만 파싱되고, tick 경로에서는 캐시만 사용"""
+    task = create_mock_task(at="10:00")
+    task.at = "not-a-time" # 대입은 검증하지 않음. 실행 경로에서 파싱한다면 ValueError 발생
+    now = datetime(2024, 7, 15, 10, 0, 0)
+    assert registry._should_run(task, now) is True
+    assert registry._next_run_time(task, now) == now
+
+def test_next_run_time_at_uses_day_ordinal_of_last_run(registry: TaskRegistry):
+    """_next_run_time: at 작업은 마지막 실행이 '오늘'이면 내일, 자정 직전(어제)이면 오늘 시각으로 예약"""
+    now = datetime(2024, 7, 15, 10, 30, 0)
+    ran_today = create_mock_task(at="10:00", last_run_at=datetime(2024, 7, 15, 0, 0, 0))
+    ran_yesterday = create_mock_task(at="10:00", last_run_at=datetime(2024, 7, 14, 23, 59, 59))
+
+    assert registry._next_run_time(ran_today, now) == datetime(2024, 7, 16, 10, 0, 0)
+    assert registry._next_run_time(ran_yesterday, now) == datetime(2024, 7, 15, 10, 0, 0)
+    assert registry._should_run(ran_today, now) is False
+    assert registry._should_run(ran_yesterday, now) is True
+
+def test_at_fire_time_is_cached_per_day(registry: TaskRegistry):
+    """_at_fire_time: 같은 날에는 캐시된 실행 시각을 재사용하고, 날짜가 바뀌면 다시 계산"""
+    task = create_mock_task(at="07:30")
+    fire_today = registry._at_fire_time(task, datetime(2024, 7, 15, 6, 0, 0))
+    assert fire_today == datetime(2024, 7, 15, 7, 30, 0)
+    assert registry._at_fire_time(task, datetime(2024, 7, 15, 23, 59, 0)) is fire_today
+
+    assert registry._at_fire_time(task, datetime(2024, 7, 16, 0, 0, 1)) == datetime(2024, 7, 16, 7, 30, 0)
+
+    task.update(create_mock_task(at="08:00")) # at이 바뀌면 캐시 무효화
+    assert registry._at_fire_time(task, datetime(2024, 7, 16, 1, 0, 0)) == datetime(2024, 7, 16, 8, 0, 0)
+
+def test_deps_ready_uses_satisfied_counter(registry: TaskRegistry):
+    """_deps_ready: 선행 작업이 처음 성공/삭제/재등록될 때 갱신되는 카운터로 판단"""
+    dep_task = create_mock_task(id="dep", run_at=datetime(2024, 7, 15, 10, 0, 0))
+    main_task = create_mock_task(id="main", run_at=datetime(2024, 7, 15, 10, 0, 0), depends_on=["dep"])
+    registry.register(main_task) # 선행 작업보다 먼저 등록될 수 있음
+    registry.register(dep_task)
+    assert main_task._deps_satisfied == 0
+    assert not registry._deps_ready(main_task)
 
-@freeze_time("2024-07-15 10:00:00")
-def test_should_run_every_task(registry: TaskRegistry):
-    """_should_run: every 작업 테스트"""
-    now = datetime.now()
+    registry._execute_task_logic(dep_task, {}, datetime(2024, 7, 15, 10, 0, 0))
+    assert main_task._deps_satisfied == 1
+    assert registry._deps_ready(main_task)
+
+    registry.delete("dep")
+    assert main_task._deps_satisfied == 0
+    assert not registry._deps_ready(main_task)
 
-    # 첫 실행
-    task_first_run = create_mock_task(every={"seconds": 10})
-    assert registry._should_run(task_first_run, now) is True
+    registry.register(dep_task) # 이미 성공 이력이 있는 작업을 다시 등록
+    assert main_task._deps_satisfied == 1
 
-    # 간격 경과 전
-    task_before_interval = create_mock_task(every={"seconds": 10}, last_run_at=now - timedelta(seconds=5))
-    assert registry._should_run(task_before_interval, now) is False
 
-    # 간격 경과 정각
-    task_on_interval = create_mock_task(every={"seconds": 10}, last_run_at=now - timedelta(seconds=10))
-    assert registry._should_run(task_on_interval, now) is True
+def test_duplicate_dependency_ids_count_once(clocked_registry: TaskRegistry, clock: ManualClock):
+    """depends_on의 중복 ID는 하나로 합쳐져, 선행 작업이 한 번 성공하면 카운터가 다 참"""
+    registry = clocked_registry
+    main_func = MagicMock()
+    registry.register(create_mock_task(id="dep", run_at=clock.now))
+    main_task = registry.register(create_mock_task(id="main", run_at=clock.now, func=main_func, depends_on=["dep", "dep"]))
+    assert main_task.depends_on == ["dep"]
+
+    registry.tick() # dep 실행, main은 선행 작업 대기
+    registry.tick() # main 실행
+    assert main_task._deps_satisfied == len(main_task.depends_on) == 1
+    main_func.assert_called_once_with(dep_dep="success")
+
+
+def test_first_dependency_success_wakes_waiting_dependent(registry: TaskRegistry):
+    """_execute_task_logic: 선행 작업의 첫 성공으로 대기 작업이 실행 가능해지면 스케줄러 루프를 깨움"""
+    now = datetime(2024, 7, 15, 10, 0, 0)
+    dep_task = registry.register(create_mock_task(id="dep", run_at=now + timedelta(hours=1)))
+    registry.register(create_mock_task(id="main", run_at=now, depends_on=["dep"]))
+    with freeze_time(now):
+        registry.tick()
+    assert "main" in registry._blocked
+
+    registry._wake.clear()
+    registry._execute_task_logic(dep_task, {}, now)
+    assert registry._wake.is_set()
+    assert "main" in registry._waiting and "main" not in registry._blocked
+
+    registry._wake.clear()
+    registry._execute_task_logic(dep_task, {}, now) # 두 번째 성공은 준비 상태를 바꾸지 않음
+    assert not registry._wake.is_set()
+
+
+def test_injected_clock_drives_register_and_tick(clocked_registry: TaskRegistry, clock: ManualClock):
+    """TaskRegistry(clock=...): freezegun 없이 주입한 시계로 예약/실행 시각이 정해짐"""
+    task = clocked_registry.register(create_mock_task(id="clocked", every={"seconds": 30}))
+    assert task.next_run_at == clock.now
 
-    # 간격 경과 후
-    task_after_interval = create_mock_task(every={"seconds": 10}, last_run_at=now - timedelta(seconds=15))
-    assert registry._should_run(task_after_interval, now) is True
+    clocked_registry.tick()
+    assert task.last_run_at == datetime(2024, 7, 15, 10, 0, 0)
+    assert task.next_run_at == datetime(2024, 7, 15, 10, 0, 30)
+
+    clock.advance(seconds=29)
+    clocked_registry.tick()
+    assert task.func.call_count == 1 # 아직 30초가 지나지 않음
+    clock.advance(seconds=1)
+    clocked_registry.tick()
+    assert task.func.call_count == 2
+
+
+def test_blocked_task_is_not_rechecked_until_dependencies_succeed(clocked_registry: TaskRegistry, clock: ManualClock):
+    """tick: 선행 작업을 기다리는 작업은 매 tick 다시 판정하지 않고, 선행 작업이 성공하면 다음 tick에 실행"""
+    registry = clocked_registry
+    now = clock.now
+    dep_func = MagicMock(return_value="dep result")
+    main_func = MagicMock()
+    registry.register(create_mock_task(id="dep", run_at=now + timedelta(seconds=5), func=dep_func))
+    registry.register(create_mock_task(id="main", run_at=now, func=main_func, depends_on=["dep"]))
+    registry.tick()
+    assert registry._blocked == {"main"}
+
+    with patch.object(registry, "_check_runnable", wraps=registry._check_runnable) as check:
+        clock.advance(seconds=1)
+        registry.tick()
+        check.assert_not_called() # 대기 중인 작업은 tick 경로에 없음
+
+        clock.advance(seconds=4)
+        registry.tick() # dep 실행 → main이 _waiting으로 옮겨짐
+        registry.tick() # main 실행
+    main_func.assert_called_once_with(dep_dep="dep result")
+    assert not registry._blocked and not registry._waiting
+
+
+def test_blocked_task_ignores_direct_store_edits_until_update(clocked_registry: TaskRegistry, clock: ManualClock):
+    """tick: 대기 중인 작업은 store를 직접 고쳐도 다시 판정되지 않고, update() 후 다음 tick에 실행"""
+    registry = clocked_registry
+    main_func = MagicMock()
+    dep_task = registry.register(create_mock_task(id="dep", run_at=clock.now + timedelta(hours=1)))
+    main_task = registry.register(create_mock_task(id="main", run_at=clock.now, func=main_func, depends_on=["dep"]))
+    registry.tick()
+    assert registry._blocked == {"main"}
+
+    dep_task.last_success_at = clock.now # 카운터를 거치지 않는 직접 수정
+    registry.tick()
+    main_func.assert_not_called()
+
+    registry.update(create_mock_task(id="main", run_at=main_task.run_at, func=main_func, depends_on=["dep"]))
+    registry.tick()
+    main_func.assert_called_once()
+    assert not registry._blocked
+
+
+def test_check_runnable_states(registry: TaskRegistry):
+    """_check_runnable: 실행 중 / 시간 조건 미충족 / 선행 작업 대기 / 실행 가능을 한 번에 판정"""
+    from est_alan_scheduler.task_registry import _BLOCKED, _BUSY, _NOT_DUE, _RUNNABLE
+    now = datetime(2024, 7, 15, 10, 0, 0)
+    registry.register(create_mock_task(id="dep", run_at=now + timedelta(hours=1)))
+
+    assert registry._check_runnable(create_mock_task(run_at=now), now) == _RUNNABLE
+    assert registry._check_runnable(create_mock_task(run_at=now, status=TaskStatus.RUNNING), now) == _BUSY
+    assert registry._check_runnable(create_mock_task(run_at=now + timedelta(seconds=1)), now) == _NOT_DUE
+    # 시간 조건이 먼저: 선행 작업이 없어도 아직 시각 전이면 _NOT_DUE
+    assert registry._check_runnable(create_mock_task(run_at=now + timedelta(seconds=1), depends_on=["dep"]), now) == _NOT_DUE
+    assert registry._check_runnable(create_mock_task(run_at=now, depends_on=["dep"]), now) == _BLOCKED
 
 
 def test_should_run_no_schedule_option_returns_false(registry: TaskRegistry):
@@ -237,10 +506,11 @@ def test_execute_task_logic_success(registry: TaskRegistry):
     assert abs(task.last_success_at - datetime.now()) < timedelta(seconds=1) # 거의 현재 시간
     assert len(task.history) == 1
     history_entry = task.history[0]
-    assert history_entry["run_at"] == current_run_time
-    assert history_entry["status"] == TaskStatus.SUCCESS
-    assert history_entry["result"] == repr("Test Success")
-    assert history_entry["error"] is None
+    assert isinstance(history_entry, HistoryEntry)
+    assert history_entry.run_at == current_run_time
+    assert history_entry.status == TaskStatus.SUCCESS
+    assert history_entry.result == repr("Test Success")
+    assert history_entry.error is None
 
 
 def test_execute_task_logic_failure(registry: TaskRegistry):
@@ -262,17 +532,118 @@ def test_execute_task_logic_failure(registry: TaskRegistry):
     assert task.last_success_at is None # 성공한 적 없음
     assert len(task.history) == 1
     history_entry = task.history[0]
-    assert history_entry["run_at"] == current_run_time
-    assert history_entry["status"] == TaskStatus.FAILED
-    assert history_entry["result"] is None
-    assert history_entry["error"] == f"ValueError: {error_message}"
+    assert isinstance(history_entry, HistoryEntry)
+    assert history_entry.run_at == current_run_time
+    assert history_entry.status == TaskStatus.FAILED
+    assert history_entry.result is None
+    assert history_entry.error == f"ValueError: {error_message}"
+
+def test_execute_task_logic_publishes_status_after_bookkeeping(registry: TaskRegistry):
+    """_execute_task_logic: 성공 시각/history 기록을 마칠 때까지 RUNNING을 유지하고 최종 상태는 마지막에 공개"""
+    task = registry.register(create_mock_task(id="slow_books", every={"seconds": 1}))
+    task.status = TaskStatus.RUNNING
+    seen = []
+    real_mark = registry._mark_first_success
+
+    def mark_first_success(t, success_at):
+        seen.append(t.status) # 이 시점에 RUNNING이 아니면 다음 tick이 다시 선택할 수 있음
+        real_mark(t, success_at)
+
+    with patch.object(registry, "_mark_first_success", mark_first_success):
+        registry._execute_task_logic(task, {}, datetime(2024, 7, 15, 10, 0, 0))
+
+    assert seen == [TaskStatus.RUNNING]
+    assert task.status == TaskStatus.SUCCESS
+    assert task.history[-1].status == TaskStatus.SUCCESS and task.history[-1].result == "'success'"
+
+
+def test_execute_task_logic_success_time_tracks_elapsed(registry: TaskRegistry):
+    """_execute_task_logic: last_success_at = 실행 시각 + 함수 실행에 걸린 시간"""
+    with freeze_time("2024-07-15 10:00:00") as frozen:
+        task = create_mock_task(every={"seconds": 1}, func=lambda: frozen.tick(timedelta(seconds=3)))
+        current_run_time = datetime.now()
+        task.status = TaskStatus.RUNNING
+        task.last_run_at = current_run_time
+
+        registry._execute_task_logic(task, {}, current_run_time)
+
+    assert task.status == TaskStatus.SUCCESS
+    assert task.last_success_at == datetime(2024, 7, 15, 10, 0, 3)
+
+def test_execute_task_logic_history_result_repr_is_lazy(registry: TaskRegistry):
+    """_execute_task_logic: history의 result repr은 읽을 때 한 번만 계산"""
+    repr_calls = []
+
+    class Result:
+        def __repr__(self):
+            repr_calls.append(1)
+            return "<Result>"
+
+    task = create_mock_task(func=MagicMock(return_value=Result()))
+    registry._execute_task_logic(task, {}, datetime(2024, 7, 15, 10, 0, 0))
+    assert repr_calls == [] # 실행 시점에는 repr하지 않음
+
+    entry = task.history[0]
+    assert entry.result == "<Result>"
+    assert str(entry.result) == "<Result>"
+    assert len(repr_calls) == 1
+
+
+def test_execute_task_logic_record_result_repr_keeps_run_time_value(registry: TaskRegistry):
+    """_execute_task_logic: record_result_repr이면 실행 시점의 repr을, 기본값이면 처음 읽는 시점의 repr을 기록"""
+    def make_func():
+        items = []
+        def append_next():
+            items.append(len(items))
+            return items # 매 실행 같은 list를 고쳐서 반환
+        return append_next
+
+    eager = create_mock_task(func=make_func(), record_result_repr=True)
+    lazy = create_mock_task(func=make_func())
+    for task in (eager, lazy):
+        for _ in range(3):
+            registry._execute_task_logic(task, {}, datetime(2024, 7, 15, 10, 0, 0))
+
+    assert [entry.result for entry in eager.history] == ["[0]", "[0, 1]", "[0, 1, 2]"]
+    assert [entry.result for entry in lazy.history] == ["[0, 1, 2]"] * 3
+
+
+def test_task_history_serializes_as_list_of_plain_records(registry: TaskRegistry):
+    """history: 직렬화 시 list로 바뀌고, 지연 계산된 result repr도 문자열로 확정됨"""
+    task = create_mock_task(id="dumped", func=MagicMock(return_value={"a": 1}))
+    registry._execute_task_logic(task, {}, datetime(2024, 7, 15, 10, 0, 0))
+
+    dumped = task.model_dump(exclude={"func"})
+    assert dumped["history"] == [
+        {"run_at": datetime(2024, 7, 15, 10, 0, 0), "status": TaskStatus.SUCCESS, "result": "{'a': 1}", "error": None}
+    ]
+    assert type(dumped["history"][0]["result"]) is str
+    assert '"result":"{\'a\': 1}"' in task.model_dump_json(exclude={"func"})
+
+
+def test_execute_task_logic_skips_history_when_disabled(registry: TaskRegistry):
+    """_execute_task_logic: max_history_entries=0이면 결과 repr을 만들지 않음"""
+    repr_calls = []
+
+    class Result:
+        def __repr__(self):
+            repr_calls.append(1)
+            return "Result()"
+
+    task = create_mock_task(every={"seconds": 1}, func=MagicMock(return_value=Result()), max_history_entries=0)
+
+    registry._execute_task_logic(task, {}, datetime.now())
+
+    assert task.status == TaskStatus.SUCCESS
+    assert len(task.history) == 0
+    assert repr_calls == []
 
 # ───────────────────────────── tick 메서드 테스트 ───────────────────────────────
 
 @freeze_time("2024-07-15 10:00:00")
 def test_tick_runs_due_task(registry: TaskRegistry):
     """tick: 실행 시간된 작업 실행 및 상태 업데이트 테스트"""
-    mock_func = MagicMock(return_value="OK")
+    mock_func = Spy(result="OK")
     # 10:00:00에 실행되어야 할 작업
     task = create_mock_task(id="due_task", run_at=datetime(2024, 7, 15, 10, 0, 0), func=mock_func)
     registry.register(task)
@@ -290,7 +661,7 @@ def test_tick_runs_due_task(registry: TaskRegistry):
 @freeze_time("2024-07-15 09:59:50") # tick 호출 10초 전
 def test_tick_does_not_run_task_not_due(registry: TaskRegistry):
     """tick: 아직 실행 시간 안된 작업은 실행 안 함"""
-    mock_func = MagicMock()
+    mock_func = Spy()
     # 10:00:00에 실행되어야 할 작업
     task = create_mock_task(id="not_due_task", run_at=datetime(2024, 7, 15, 10, 0, 0), func=mock_func)
     registry.register(task)
@@ -304,7 +675,7 @@ def test_tick_does_not_run_task_not_due(registry: TaskRegistry):
 @freeze_time("2024-07-15 10:00:00")
 def test_tick_runs_task_with_met_dependencies(registry: TaskRegistry):
     """tick: 의존성 충족된 작업 실행 테스트"""
-    dep_func = MagicMock(return_value="Dep Done")
+    dep_func = Spy(result="Dep Done")
     dep_task = create_mock_task(id="dep1", run_at=datetime(2024,7,15, 9,59,59), func=dep_func) # 이전 tick에서 실행될 것
     dep_task.last_success_at = datetime(2024,7,15, 9,59,59) # 이미 성공했다고 가정
     dep_task.last_run_at = dep_task.run_at # 현재 tick에서 다시 실행되지 않도록 설정 (들여쓰기 수정)
@@ -313,7 +684,7 @@ def test_tick_runs_task_with_met_dependencies(registry: TaskRegistry):
     registry.register(dep_task)
 
 
-    main_func = MagicMock()
+    main_func = Spy()
     main_task = create_mock_task(
         id="main_task",
         run_at=datetime(2024, 7, 15, 10, 0, 0),
@@ -334,13 +705,61 @@ def test_tick_runs_task_with_met_dependencies(registry: TaskRegistry):
     main_func.assert_called_once_with(dep_dep1="Dep Done") # 의존성 결과 전달 확인
     assert main_task.status == TaskStatus.SUCCESS
 
+def test_tick_reuses_dependency_refs_until_dependency_replaced(clocked_registry: TaskRegistry, clock: ManualClock):
+    """tick: 선행 Task 참조는 재사용하고, 선행 작업이 삭제/재등록되면 새 객체로 다시 찾음"""
+    registry = clocked_registry
+    now = clock.now
+
+    def succeeded_dep(result):
+        dep = create_mock_task(id="dep1", run_at=now - timedelta(seconds=1), result=result,
+                               status=TaskStatus.SUCCESS, last_success_at=now - timedelta(seconds=1))
+        dep.last_run_at = dep.run_at
+        return dep
+
+    main_func = Spy()
+    old_dep = registry.register(succeeded_dep("old"))
+    main_task = registry.register(create_mock_task(id="main", every={"seconds": 10}, func=main_func, depends_on=["dep1"]))
+    registry.tick()
+    main_func.assert_called_once_with(dep_dep1="old")
+    assert main_task._dep_refs == (("dep_dep1", old_dep),)
+
+    clock.advance(seconds=10)
+    registry.delete("dep1")
+    assert main_task._dep_refs is None
+    registry.register(succeeded_dep("new"))
+    registry.tick()
+    main_func.assert_called_with(dep_dep1="new")
+    assert main_task._dep_refs[0][1] is registry.store["dep1"]
+
+def test_tick_fills_reused_call_kwargs_in_place(clocked_registry: TaskRegistry, clock: ManualClock):
+    """tick: 선행 작업 결과를 작업의 재사용 kwargs dict에 직접 채워 실행마다 dict를 새로 만들지 않음"""
+    registry = clocked_registry
+    now = clock.now
+    main_func = MagicMock()
+    dep_task = registry.register(create_mock_task(id="dep1", run_at=now - timedelta(hours=1), result=1,
+                                                  last_success_at=now - timedelta(hours=1)))
+    dep_task.last_run_at = dep_task.run_at
+    main_task = registry.register(create_mock_task(id="main", every={"seconds": 10}, func=main_func,
+                                                   kwargs={"c": 3}, depends_on=["dep1"]))
+    buffer = main_task._call_kwargs
+    with patch.object(registry, "_execute_task_logic", wraps=registry._execute_task_logic) as execute:
+        registry.tick()
+        dep_task.result = 2
+        clock.advance(seconds=10)
+        registry.tick()
+
+    assert execute.call_count == 2
+    assert all(c.args[1] is buffer for c in execute.call_args_list)
+    assert main_func.call_args_list == [call(c=3, dep_dep1=1), call(c=3, dep_dep1=2)]
+    assert main_task.kwargs == {"c": 3} # 원본 kwargs는 그대로
+
 @freeze_time("2024-07-15 10:00:00")
 def test_tick_does_not_run_task_with_unmet_dependencies(registry: TaskRegistry):
     """tick: 의존성 미충족 작업은 실행 안 함 (PENDING 유지)"""
     dep_task = create_mock_task(id="dep_unmet", run_at=datetime(2024,7,15, 10,0,0)) # 아직 성공 못함
     registry.register(dep_task)
 
-    main_func = MagicMock()
+    main_func = Spy()
     main_task = create_mock_task(
         id="main_task_unmet_dep",
         run_at=datetime(2024, 7, 15, 10, 0, 0),
@@ -391,6 +810,261 @@ def test_tick_task_status_running_prevents_re_execution(registry: TaskRegistry):
         mock_func.assert_called_once() # 이제는 호출되어야 함
 
 
+@freeze_time("2024-07-15 10:00:00")
+def test_tick_parks_overdue_running_task_instead_of_busy_looping(registry: TaskRegistry):
+    """tick: interval보다 오래 실행 중인 작업은 지난 시각으로 다시 예약되지 않고 대기 목록에서 기다림"""
+    mock_func = MagicMock()
+    task = create_mock_task(id="long_running", every={"seconds": 1}, func=mock_func)
+    registry.register(task)
+    task.status = TaskStatus.RUNNING
+    task.last_run_at = datetime(2024, 7, 15, 9, 59, 0) # 1분째 실행 중
+
+    registry.tick()
+    mock_func.assert_not_called()
+    assert task.next_run_at is None
+    assert "long_running" in registry._waiting
+    assert registry.seconds_until_next_run(5.0) == 5.0 # 루프는 interval만큼 쉼
+
+    task.status = TaskStatus.SUCCESS # 실행 종료
+    registry.tick()
+    mock_func.assert_called_once()
+
+
+@freeze_time("2024-07-15 10:00:00")
+def test_tick_pure_task_reuses_result_until_dependency_reruns(registry: TaskRegistry):
+    """tick: pure 작업은 선행 작업이 다시 실행될 때만 func를 호출하고, 그 외에는 result 재사용"""
+    dep_func = MagicMock(return_value="page")
+    pure_func = MagicMock(return_value="parsed")
+    registry.register(create_mock_task(id="fetch", every={"seconds": 10}, func=dep_func))
+    pure_task = registry.register(create_mock_task(id="parse", every={"seconds": 5}, func=pure_func,
+                                                   depends_on=["fetch"], pure=True))
+
+    registry.tick() # fetch 실행, parse는 선행 작업 대기
+    with freeze_time("2024-07-15 10:00:01"):
+        registry.tick()
+    pure_func.assert_called_once_with(dep_fetch="page")
+
+    with freeze_time("2024-07-15 10:00:06"): # fetch는 그대로 → 재사용
+        registry.tick()
+    pure_func.assert_called_once()
+    assert pure_task.status == TaskStatus.SUCCESS
+    assert pure_task.result == "parsed"
+    assert pure_task.last_run_at == datetime(2024, 7, 15, 10, 0, 6)
+
+    with freeze_time("2024-07-15 10:00:10"): # fetch 재실행 → parse도 다시 계산
+        registry.tick()
+    with freeze_time("2024-07-15 10:00:11"):
+        registry.tick()
+    assert pure_func.call_count == 2
+
+
+def test_tick_pure_task_reruns_after_dependency_is_replaced(clocked_registry: TaskRegistry, clock: ManualClock):
+    """tick: 선행 작업을 delete 후 같은 ID의 새 작업으로 다시 등록하면 pure 작업도 다시 실행"""
+    registry = clocked_registry
+    pure_func = MagicMock(side_effect=lambda dep_dep: dep_dep)
+    registry.register(create_mock_task(id="dep", run_at=clock.now, func=MagicMock(return_value="old")))
+    pure_task = registry.register(create_mock_task(id="pure", every={"seconds": 10}, func=pure_func,
+                                                   depends_on=["dep"], pure=True))
+    registry.tick() # dep 실행
+    registry.tick() # pure 실행 → "old"
+    assert pure_task.result == "old"
+
+    registry.delete("dep")
+    registry.register(create_mock_task(id="dep", run_at=clock.now, func=MagicMock(return_value="new")))
+    clock.advance(seconds=10)
+    registry.tick() # 새 dep 실행 (버전이 다시 1부터 시작)
+    clock.advance(seconds=10)
+    registry.tick()
+    assert pure_task.result == "new"
+    assert pure_func.call_count == 2
+
+
+def test_execute_task_logic_pure_task_with_missing_dependency_fails(registry: TaskRegistry):
+    """_execute_task_logic: pure 작업의 선행 작업이 store에 없으면 예외 없이 실패로 기록하고 func는 호출하지 않음"""
+    func = MagicMock()
+    task = create_mock_task(id="orphan", every={"seconds": 1}, func=func, depends_on=["missing"], pure=True)
+    registry._execute_task_logic(task, {}, datetime(2024, 7, 15, 10, 0, 0))
+
+    func.assert_not_called()
+    assert task.status == TaskStatus.FAILED
+    assert task.error_message == "Dependency data not found during execution: 'missing'"
+    assert task.history[-1].status == TaskStatus.FAILED
+
+
+@freeze_time("2024-07-15 10:00:00")
+def test_tick_reschedules_every_task_after_run(registry: TaskRegistry):
+    """tick: every 작업은 실행 후 interval 뒤로 다시 예약됨"""
+    mock_func = MagicMock()
+    task = create_mock_task(id="every_task", every={"seconds": 10}, func=mock_func)
+    registry.register(task)
+
+    registry.tick()
+    assert mock_func.call_count == 1
+    assert task.next_run_at == datetime(2024, 7, 15, 10, 0, 10)
+
+    with freeze_time("2024-07-15 10:00:09"):
+        registry.tick()
+        assert mock_func.call_count == 1 # 아직 interval 경과 전
+
+    with freeze_time("2024-07-15 10:00:10"):
+        registry.tick()
+        assert mock_func.call_count == 2
+
+
+@freeze_time("2024-07-15 10:00:00")
+def test_tick_only_evaluates_due_tasks_in_large_registry(registry: TaskRegistry):
+    """tick: 작업이 많아도 실행 시각이 된 작업만 검사 (전체 순회 없음)"""
+    for i in range(2000):
+        registry.register(create_mock_task(id=f"idle_{i}", every={"hours": 1}))
+    registry.tick() # 첫 실행 → 모두 1시간 뒤로 예약
+    registry.register(create_mock_task(id="due_now", run_at=datetime(2024, 7, 15, 10, 0, 0)))
+
+    with patch.object(registry, "_check_runnable", wraps=registry._check_runnable) as check_runnable:
+        registry.tick()
+    assert check_runnable.call_count == 1
+    assert registry.store["due_now"].status == TaskStatus.SUCCESS
+
+
+@freeze_time("2024-07-15 10:00:00")
+def test_tick_does_not_reschedule_finished_run_at_task(registry: TaskRegistry):
+    """tick: run_at 작업은 실행 후 힙에서 제거됨"""
+    task = create_mock_task(id="once", run_at=datetime(2024, 7, 15, 10, 0, 0))
+    registry.register(task)
+
+    registry.tick()
+    assert task.status == TaskStatus.SUCCESS
+    assert task.next_run_at is None
+
+
+@freeze_time("2024-07-15 10:00:00")
+def test_seconds_until_next_run(registry: TaskRegistry):
+    """seconds_until_next_run: 가장 이른 실행 예정 시각까지 남은 시간, max_wait 상한"""
+    assert registry.seconds_until_next_run(5.0) == 5.0 # 등록된 작업 없음
+
+    registry.register(create_mock_task(id="soon", run_at=datetime(2024, 7, 15, 10, 0, 2)))
+    registry.register(create_mock_task(id="later", run_at=datetime(2024, 7, 15, 11, 0, 0)))
+    assert registry.seconds_until_next_run(5.0) == 2.0
+    assert registry.seconds_until_next_run(1.0) == 1.0
+
+    registry.delete("soon") # 삭제된 작업의 항목은 무시됨
+    assert registry.seconds_until_next_run(5.0) == 5.0
+
+    registry.register(create_mock_task(id="overdue", run_at=datetime(2024, 7, 15, 9, 0, 0)))
+    assert registry.seconds_until_next_run(5.0) == 0.0
+
+
+def test_run_heap_is_compacted_after_many_updates(registry: TaskRegistry):
+    """_schedule: update가 반복되어 무효 항목이 쌓여도 힙 크기가 작업 수에 비례해 유지됨"""
+    registry.register(create_mock_task(id="other", run_at=datetime(2024, 7, 15, 12, 0, 0)))
+    for minute in range(500):
+        registry.update(create_mock_task(id="other", run_at=datetime(2024, 7, 15, 12, 0, 0) + timedelta(minutes=minute)))
+    assert len(registry._run_heap) <= 2 * len(registry.store) + registry._HEAP_SLACK
+    live_entries = [entry for entry in registry._run_heap if registry._is_live(entry)]
+    assert live_entries == [(datetime(2024, 7, 15, 12, 0, 0) + timedelta(minutes=499), "other")]
+
+
+def test_wait_for_next_run_wakes_on_register(registry: TaskRegistry):
+    """wait_for_next_run: 대기 중 작업이 등록되면 max_wait을 기다리지 않고 바로 반환"""
+    results = []
+    waiter = threading.Thread(target=lambda: results.append(registry.wait_for_next_run(5.0)))
+    waiter.start()
+    registry.register(create_mock_task(id="new", every={"seconds": 1}))
+    waiter.join(timeout=1.0)
+    assert not waiter.is_alive()
+    assert results == [True]
+
+    registry.tick() # wake 신호는 tick 시작 시 지워짐
+    assert registry.wait_for_next_run(0.0) is False # 깨우는 일 없이 max_wait 경과
+
+
+def test_wake_between_tick_and_wait_is_not_lost(registry: TaskRegistry):
+    """wait_for_next_run: tick이 끝난 뒤 대기 전에 호출된 wake()도 놓치지 않고 바로 반환"""
+    registry.tick()
+    registry.wake() # 예: 풀 작업 완료, 선행 작업의 첫 성공
+    assert registry.wait_for_next_run(5.0) is True
+
+
+def test_seconds_until_next_run_reuses_tick_clock(registry: TaskRegistry):
+    """seconds_until_next_run: tick 이후에는 벽시계를 다시 읽지 않고 tick 시각 + monotonic 경과 시간 사용"""
+    with freeze_time("2024-07-15 10:00:00") as frozen:
+        registry.register(create_mock_task(id="later", run_at=datetime(2024, 7, 15, 10, 0, 10)))
+        registry.tick()
+        frozen.tick(timedelta(seconds=4))
+        with patch("est_alan_scheduler.task_registry.datetime") as mock_datetime:
+            mock_datetime.now.side_effect = AssertionError("wall clock read")
+            assert registry.seconds_until_next_run(60.0) == pytest.approx(6.0)
+
+
+@freeze_time("2024-07-15 10:00:00")
+def test_update_reschedules_task(registry: TaskRegistry):
+    """update: 바뀐 스케줄 옵션 기준으로 다시 예약됨"""
+    registry.register(create_mock_task(id="task", run_at=datetime(2024, 7, 15, 12, 0, 0)))
+    registry.update(create_mock_task(id="task", at="10:30"))
+    assert registry.store["task"].next_run_at == datetime(2024, 7, 15, 10, 30, 0)
+
+
+def test_tick_with_thread_pool_does_not_wait_for_slow_task():
+    """tick: max_workers가 있으면 작업을 스레드 풀에서 실행하고, 느린 작업이 다른 작업을 막지 않음"""
+    registry = TaskRegistry(max_workers=2)
+    release_slow = threading.Event()
+    fast_done = threading.Event()
+    registry.register(create_mock_task(id="slow", run_at=datetime.now(), func=release_slow.wait))
+    registry.register(create_mock_task(id="fast", run_at=datetime.now(), func=fast_done.set))
+
+    try:
+        registry.tick() # 완료를 기다리지 않고 반환
+        assert fast_done.wait(timeout=1.0)
+        assert registry.store["slow"].status == TaskStatus.RUNNING
+
+        registry.tick() # 실행 중인 작업은 다시 제출되지 않음
+    finally:
+        release_slow.set()
+        registry.shutdown()
+
+    assert registry.store["slow"].status == TaskStatus.SUCCESS
+    assert len(registry.store["slow"].history) == 1
+
+
+def test_tick_with_thread_pool_counts_queue_wait_in_success_time():
+    """tick: 풀 큐에서 기다린 작업의 last_success_at도 실행 시각 + tick 이후 실제 경과 시간"""
+    registry = TaskRegistry(max_workers=1) # a_slow가 끝날 때까지 b_queued는 큐에서 대기
+    now = datetime.now()
+    registry.register(create_mock_task(id="a_slow", run_at=now, func=lambda: threading.Event().wait(0.2)))
+    queued = registry.register(create_mock_task(id="b_queued", run_at=now))
+    try:
+        registry.tick()
+    finally:
+        registry.shutdown()
+
+    assert queued.status == TaskStatus.SUCCESS
+    assert queued.last_success_at - queued.last_run_at >= timedelta(seconds=0.2)
+
+
+def test_tick_with_full_thread_pool_defers_tasks_to_next_tick():
+    """tick: 풀의 실행 중 + 대기 작업이 한도에 닿으면 나머지는 제출하지 않고 다음 tick으로 미룸"""
+    registry = TaskRegistry(max_workers=1, max_queued=0)
+    release_first = threading.Event()
+    second_done = threading.Event()
+    registry.register(create_mock_task(id="first", run_at=datetime.now(), func=release_first.wait))
+    registry.register(create_mock_task(id="second", run_at=datetime.now(), func=second_done.set))
+
+    try:
+        registry.tick()
+        assert registry.store["first"].status == TaskStatus.RUNNING
+        assert registry.store["second"].status == TaskStatus.PENDING # 큐에 넣지 않음
+        assert registry.store["second"].last_run_at is None
+        assert "second" in registry._waiting
+
+        registry._wake.clear()
+        release_first.set()
+        assert registry._wake.wait(timeout=1.0) # 자리가 나면 스케줄러 루프를 깨움
+        registry.tick()
+        assert second_done.wait(timeout=1.0)
+    finally:
+        release_first.set()
+        registry.shutdown()
+
+
 @freeze_time("2024-07-15 10:00:00")
 def test_tick_handles_dependency_data_preparation_failure(registry: TaskRegistry):
     """tick: 의존성 데이터 준비 중 오류 발생 시 작업 실패 처리 (방어적 코드)"""